@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from src.backtesting.kernels import fused_metrics, run_backtest_numpy
 
 class BacktestRunner:
     """
@@ -22,9 +23,12 @@ class BacktestRunner:
         :return: Dictionary containing results and performance metrics.
         """
         data = self.strategy.generate_signals(data)
-        data["Position"] = data["Signal"].shift(1).fillna(0)
-        data["PnL"] = data["Position"] * (data["close"].diff().fillna(0))
-        data["Equity"] = self.initial_balance + data["PnL"].cumsum()
+        position, pnl, equity = run_backtest_numpy(
+            data["close"].to_numpy(), data["Signal"].to_numpy(), self.initial_balance
+        )
+        data["Position"] = position
+        data["PnL"] = pnl
+        data["Equity"] = equity
 
         metrics = self.calculate_metrics(data)
         return {"results": data, "metrics": metrics}
@@ -35,11 +39,9 @@ class BacktestRunner:
         :param data: DataFrame with backtest results.
         :return: Dictionary of performance metrics.
         """
-        total_pnl = data["PnL"].sum()
-        returns = data["PnL"] / self.initial_balance
-        sharpe_ratio = self.calculate_sharpe_ratio(returns)
-        max_drawdown = self.calculate_max_drawdown(data["Equity"])
-        win_rate = (data["PnL"] > 0).mean()
+        total_pnl, sharpe_ratio, max_drawdown, win_rate = fused_metrics(
+            data["PnL"].to_numpy(), self.initial_balance
+        )
 
         return {
             "Total PnL": total_pnl,
@@ -63,11 +65,12 @@ class BacktestRunner:
     def calculate_max_drawdown(equity_curve):
         """
         Calculate the maximum drawdown.
-        :param equity_curve: Series of equity values over time.
+        :param equity_curve: Array of equity values over time.
         :return: Maximum drawdown as a percentage.
         """
-        peak = equity_curve.cummax()
-        drawdown = (equity_curve - peak) / peak
+        equity_curve = np.asarray(equity_curve, dtype=np.float64)
+        peak = np.maximum.accumulate(equity_curve)
+        drawdown = np.divide(equity_curve - peak, peak, out=np.zeros_like(peak), where=peak > 0)
         return drawdown.min()
 
 
@@ -1,5 +1,34 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from src.backtesting.kernels import rolling_mean, rolling_std, rsi_wilder
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+
+def _read_csv_arrow(file_path):
+    """
+    Read the CSV with the multi-threaded Arrow parser, price columns declared as float32.
+    The timestamp type is inferred, so naive and offset timestamps both load
+    (offset timestamps come back tz-aware in UTC).
+    :param file_path: Path to the CSV file.
+    :return: DataFrame, or None when Arrow cannot parse the file as timestamped bars.
+    """
+    column_types = {column: pa.float32() for column in PRICE_COLUMNS}
+    try:
+        table = pa_csv.read_csv(file_path, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    except pa.ArrowInvalid:
+        return None
+    if "timestamp" not in table.column_names or not pa.types.is_timestamp(table.schema.field("timestamp").type):
+        return None
+    return table.to_pandas()
+
 
 class PrepareDateRange:
     """
@@ -14,7 +43,12 @@ class PrepareDateRange:
         :return: DataFrame containing historical market data.
         """
         try:
-            data = pd.read_csv(file_path, parse_dates=["timestamp"])
+            data = _read_csv_arrow(file_path) if pa is not None else None
+            if data is None:
+                data = pd.read_csv(file_path, parse_dates=["timestamp"])
+                for column in PRICE_COLUMNS:
+                    if column in data:
+                        data[column] = data[column].astype(np.float32)
             data.sort_values("timestamp", inplace=True)
             return data
         except Exception as e:
@@ -27,40 +61,38 @@ class PrepareDateRange:
         :param data: DataFrame with raw market data.
         :return: Preprocessed DataFrame.
         """
-        data["SMA_20"] = data["close"].rolling(window=20).mean()
-        data["SMA_50"] = data["close"].rolling(window=50).mean()
-        data["Volatility"] = data["close"].rolling(window=20).std()
-        data["RSI"] = PrepareDateRange.calculate_rsi(data["close"])
+        close = np.ascontiguousarray(data["close"].to_numpy(dtype=np.float32))
+        data["SMA_20"] = rolling_mean(close, 20)
+        data["SMA_50"] = rolling_mean(close, 50)
+        data["Volatility"] = rolling_std(close, 20)
+        data["RSI"] = rsi_wilder(close, 14)
         return data.dropna()
 
     @staticmethod
     def calculate_rsi(prices, period=14):
         """
-        Calculate the Relative Strength Index (RSI).
+        Calculate the Relative Strength Index (RSI) using Wilder's smoothing.
         :param prices: Series of closing prices.
         :param period: Look-back period.
         :return: Series with RSI values.
         """
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        return pd.Series(rsi_wilder(prices.to_numpy(), period), index=prices.index)
 
     @staticmethod
     def filter_by_date_range(data, start_date=None, end_date=None):
         """
         Filter data by a specific date range.
-        :param data: DataFrame with historical data.
+        Relies on the timestamp ordering established by load_historical_data, so the
+        bounds are found by binary search and the result is a positional slice.
+        :param data: DataFrame with historical data, sorted by timestamp.
         :param start_date: Start date as a string (YYYY-MM-DD).
         :param end_date: End date as a string (YYYY-MM-DD).
         :return: Filtered DataFrame.
         """
-        if start_date:
-            data = data[data["timestamp"] >= pd.to_datetime(start_date)]
-        if end_date:
-            data = data[data["timestamp"] <= pd.to_datetime(end_date)]
-        return data
+        timestamps = data["timestamp"]
+        lo = timestamps.searchsorted(pd.to_datetime(start_date), side="left") if start_date else 0
+        hi = timestamps.searchsorted(pd.to_datetime(end_date), side="right") if end_date else len(data)
+        return data.iloc[lo:hi]
 
     @staticmethod
     def filter_by_volatility(data, threshold):
@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 class Analytics:
@@ -25,13 +26,14 @@ class Analytics:
     def plot_drawdowns(data):
         """
         Plot the drawdowns over time.
-        :param data: DataFrame with 'timestamp' and 'Equity' columns.
+        :param data: DataFrame with 'timestamp' and 'Equity' columns (left unmodified).
         """
-        data["Peak"] = data["Equity"].cummax()
-        data["Drawdown"] = (data["Equity"] - data["Peak"]) / data["Peak"]
+        equity = data["Equity"].to_numpy(dtype=np.float64)
+        peak = np.maximum.accumulate(equity)
+        drawdown = np.divide(equity - peak, peak, out=np.zeros_like(peak), where=peak > 0)
 
         plt.figure(figsize=(12, 6))
-        plt.plot(data["timestamp"], data["Drawdown"], label="Drawdown", color="red")
+        plt.plot(data["timestamp"].to_numpy(), drawdown, label="Drawdown", color="red")
         plt.title("Drawdowns")
         plt.xlabel("Time")
         plt.ylabel("Drawdown (%)")
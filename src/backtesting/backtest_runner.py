@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from src.backtesting.kernels import run_backtest_numpy
 from src.backtesting.prepare_date_range import preprocess_data, split_data
 from sklearn.metrics import accuracy_score, precision_score, recall_score
 from datetime import datetime
@@ -12,7 +14,9 @@ class BacktestRunner:
     def __init__(self, strategy, model=None):
         """
         Initialize the BacktestRunner.
-        :param strategy: Trading strategy function (e.g., mean_reversion, momentum).
+        :param strategy: Trading strategy function (e.g., mean_reversion, momentum). Functions with
+                         a truthy `vectorized` attribute receive the whole DataFrame and return an
+                         array of signals; others are applied row by row.
         :param model: Trained machine learning model for predictions (optional).
         """
         self.strategy = strategy
@@ -41,17 +45,18 @@ class BacktestRunner:
             predictions = self.model.predict(features)
             return predictions
         else:
-            return data.apply(self.strategy, axis=1)
+            return vectorize_rowwise(self.strategy)(data)
 
     def calculate_pnl(self, data):
         """
         Calculate the profit and loss (PnL) for each trade.
-        :param data: DataFrame with signals and market prices.
-        :return: Series with PnL values.
+        :param data: DataFrame with signals and market prices (left unmodified).
+        :return: Array with cumulative PnL values.
         """
-        data["Position"] = data["Signal"].shift(1).fillna(0)
-        data["PnL"] = data["Position"] * (data["close"].diff().fillna(0))
-        return data["PnL"].cumsum()
+        _, pnl, _ = run_backtest_numpy(
+            data["close"].to_numpy(), data["Signal"].to_numpy(dtype=np.float64), 0.0
+        )
+        return pnl.cumsum()
 
     def evaluate_performance(self):
         """
@@ -75,6 +80,47 @@ class BacktestRunner:
             }
 
 
+def vectorized(strategy):
+    """
+    Mark a strategy function as vectorized: it takes the whole DataFrame and returns an array of signals.
+    :param strategy: Strategy function.
+    :return: The same function, tagged.
+    """
+    strategy.vectorized = True
+    return strategy
+
+
+def vectorize_rowwise(strategy):
+    """
+    Adapt a strategy to the vectorized API. Tagged functions are returned unchanged; legacy
+    row-wise functions fall back to DataFrame.apply.
+    :param strategy: Vectorized or row-wise strategy function.
+    :return: Function taking a DataFrame and returning an array of signals.
+    """
+    if getattr(strategy, "vectorized", False):
+        return strategy
+
+    @vectorized
+    def apply_rowwise(data):
+        return data.apply(strategy, axis=1).to_numpy()
+
+    return apply_rowwise
+
+
+@vectorized
+def mean_reversion_vec(data):
+    """
+    Vectorized mean reversion strategy: buy when RSI < 30, sell when RSI > 70.
+    :param data: Preprocessed DataFrame with an RSI column.
+    :return: Array with buy (1), sell (-1), or hold (0) signals.
+    """
+    rsi = data["RSI"].to_numpy()
+    signals = np.zeros(len(data), dtype=np.int8)
+    signals[rsi < 30] = 1
+    signals[rsi > 70] = -1
+    return signals
+
+
 def run_backtest(data, strategy, model=None):
     """
     Run backtest on historical data using a strategy or ML model.
@@ -102,14 +148,5 @@ if __name__ == "__main__":
     raw_data = load_historical_data(file_path)
     data = preprocess_data(raw_data)
 
-    # Define a sample strategy (e.g., mean reversion)
-    def mean_reversion_strategy(row):
-        if row["RSI"] < 30:
-            return 1  # Buy signal
-        elif row["RSI"] > 70:
-            return -1  # Sell signal
-        else:
-            return 0  # Hold signal
-
-    # Run backtest with a sample strategy
-    run_backtest(data, strategy=mean_reversion_strategy)
+    # Run backtest with a sample strategy (e.g., mean reversion)
+    run_backtest(data, strategy=mean_reversion_vec)
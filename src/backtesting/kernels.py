@@ -0,0 +1,286 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+TRADING_DAYS = 252
+
+
+def price_changes(close):
+    """
+    Bar-to-bar price changes, 0 for the first bar.
+    :param close: Array of closing prices.
+    :return: Array of price changes with the same length as the input.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    close_diff = np.zeros_like(close)
+    close_diff[1:] = np.diff(close)
+    return close_diff
+
+
+def run_backtest_numpy(close, signal, initial_balance, close_diff=None):
+    """
+    Compute positions, PnL and the equity curve from raw price and signal arrays.
+    :param close: Array of closing prices.
+    :param signal: Array of trading signals (1 = long, -1 = short, 0 = flat).
+    :param initial_balance: Starting balance for the backtest.
+    :param close_diff: Optional precomputed price_changes(close), reused across trials.
+    :return: Tuple of (position, pnl, equity) arrays.
+    """
+    if close_diff is None:
+        close_diff = price_changes(close)
+    position = np.zeros(len(close_diff), dtype=np.float64)
+    position[1:] = signal[:-1]
+
+    pnl = position * close_diff
+    equity = initial_balance + pnl.cumsum()
+    return position, pnl, equity
+
+
+def total_pnl(close, signal):
+    """
+    Total PnL of holding signal[t-1] over bar t, in a single pass without temporaries.
+    :param close: Array of closing prices.
+    :param signal: Array of trading signals (1 = long, -1 = short, 0 = flat).
+    :return: Total PnL as a float.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    signal = np.ascontiguousarray(signal, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _total_pnl_numba(close, signal)
+    return float(signal[:-1] @ np.diff(close))
+
+
+def rolling_mean(values, window):
+    """
+    Rolling mean over a trailing window, NaN until the window is full.
+    :param values: Array of floating point values.
+    :param window: Window length.
+    :return: Array of rolling means with the same dtype as the input.
+    """
+    values = _as_float_array(values)
+    if NUMBA_AVAILABLE:
+        return _rolling_mean_numba(values, window)
+
+    out = np.full_like(values, np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).mean(axis=1, dtype=np.float64)
+    return out
+
+
+def rolling_std(values, window):
+    """
+    Rolling sample standard deviation (ddof=1) over a trailing window, NaN until the window is full.
+    :param values: Array of floating point values.
+    :param window: Window length.
+    :return: Array of rolling standard deviations with the same dtype as the input.
+    """
+    values = _as_float_array(values)
+    if NUMBA_AVAILABLE:
+        return _rolling_std_numba(values, window)
+
+    out = np.full_like(values, np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).std(axis=1, ddof=1, dtype=np.float64)
+    return out
+
+
+def rsi_wilder(close, period=14):
+    """
+    Relative Strength Index using Wilder's smoothing, computed in a single pass.
+    :param close: Array of closing prices.
+    :param period: Look-back period.
+    :return: Array of RSI values, NaN for the first `period` bars.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _rsi_wilder_numba(close, period)
+    return _rsi_wilder_loop(close, period)
+
+
+def _rsi_wilder_loop(close, period):
+    n = close.size
+    out = np.empty(n)
+    out[:period + 1] = np.nan
+    if n <= period:
+        return out
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        gain += max(delta, 0.0)
+        loss += max(-delta, 0.0)
+    gain /= period
+    loss /= period
+    out[period] = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+
+    for i in range(period + 1, n):
+        delta = close[i] - close[i - 1]
+        gain = (gain * (period - 1) + max(delta, 0.0)) / period
+        loss = (loss * (period - 1) + max(-delta, 0.0)) / period
+        out[i] = 100.0 - 100.0 / (1.0 + gain / loss) if loss > 0 else 100.0
+    return out
+
+
+def _as_float_array(values):
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    return np.ascontiguousarray(values)
+
+
+def fused_metrics(pnl, initial_balance, risk_free_rate=0.01):
+    """
+    Compute total PnL, Sharpe ratio, max drawdown and win rate in a single pass over PnL.
+    :param pnl: Array of per-bar PnL values.
+    :param initial_balance: Starting balance of the backtest.
+    :param risk_free_rate: Annual risk-free rate used for the Sharpe ratio.
+    :return: Tuple of (total_pnl, sharpe_ratio, max_drawdown, win_rate).
+    """
+    pnl = np.ascontiguousarray(pnl, dtype=np.float64)
+    rf_daily = risk_free_rate / TRADING_DAYS
+
+    if NUMBA_AVAILABLE:
+        return _fused_metrics_numba(pnl, float(initial_balance), rf_daily)
+    return tuple(_metrics_numpy(pnl[np.newaxis, :], float(initial_balance), rf_daily)[0])
+
+
+def sweep_metrics(close, signals_2d, initial_balance, risk_free_rate=0.01):
+    """
+    Evaluate many signal series against the same price history.
+    Uses a parallel Numba kernel when available, otherwise a vectorized NumPy pass.
+    :param close: Array of closing prices, shape (n_bars,).
+    :param signals_2d: Array of signals, shape (n_params, n_bars).
+    :param initial_balance: Starting balance for each backtest.
+    :param risk_free_rate: Annual risk-free rate used for the Sharpe ratio.
+    :return: Array of shape (n_params, 4) holding total PnL, Sharpe ratio, max drawdown and win rate.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    signals_2d = np.ascontiguousarray(signals_2d, dtype=np.float64)
+    rf_daily = risk_free_rate / TRADING_DAYS
+
+    if NUMBA_AVAILABLE:
+        return _sweep_metrics_numba(close, signals_2d, float(initial_balance), rf_daily)
+
+    position = np.zeros_like(signals_2d)
+    position[:, 1:] = signals_2d[:, :-1]
+    return _metrics_numpy(position * price_changes(close), float(initial_balance), rf_daily)
+
+
+def _metrics_numpy(pnl_2d, initial_balance, rf_daily):
+    n_rows, n_bars = pnl_2d.shape
+    equity = initial_balance + pnl_2d.cumsum(axis=1)
+    # The running peak starts at the initial balance, matching the Numba kernels
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), initial_balance)
+    drawdown = np.divide(equity - peak, peak, out=np.zeros_like(peak), where=peak > 0)
+
+    excess = pnl_2d / initial_balance - rf_daily
+    std = excess.std(axis=1, ddof=1) if n_bars > 1 else np.zeros(n_rows)
+    mean = excess.mean(axis=1)
+    sharpe = np.divide(mean, std, out=np.zeros(n_rows), where=std != 0)
+
+    out = np.empty((n_rows, 4))
+    out[:, 0] = pnl_2d.sum(axis=1)
+    out[:, 1] = sharpe
+    out[:, 2] = drawdown.min(axis=1)
+    out[:, 3] = (pnl_2d > 0).mean(axis=1)
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _rsi_wilder_numba = njit(cache=True)(_rsi_wilder_loop)
+
+    @njit(cache=True, fastmath=True)
+    def _total_pnl_numba(close, signal):
+        total = 0.0
+        for i in range(1, close.size):
+            total += signal[i - 1] * (close[i] - close[i - 1])
+        return total
+
+    @njit(cache=True, fastmath=True)
+    def _fused_metrics_numba(pnl, initial_balance, rf_daily):
+        n = pnl.size
+        total = 0.0
+        mean = 0.0
+        m2 = 0.0
+        wins = 0
+        equity = initial_balance
+        peak = initial_balance
+        max_dd = 0.0
+
+        for i in range(n):
+            total += pnl[i]
+            # Welford's online update keeps the variance stable in one pass
+            r = pnl[i] / initial_balance - rf_daily
+            delta = r - mean
+            mean += delta / (i + 1)
+            m2 += delta * (r - mean)
+            if pnl[i] > 0:
+                wins += 1
+            equity += pnl[i]
+            if equity > peak:
+                peak = equity
+            if peak > 0:
+                dd = (equity - peak) / peak
+                if dd < max_dd:
+                    max_dd = dd
+
+        sharpe = 0.0
+        if n > 1:
+            var = m2 / (n - 1)
+            if var > 0:
+                sharpe = mean / np.sqrt(var)
+        win_rate = wins / n if n > 0 else 0.0
+        return total, sharpe, max_dd, win_rate
+
+    @njit(cache=True, parallel=True)
+    def _sweep_metrics_numba(close, signals_2d, initial_balance, rf_daily):
+        n_params, n_bars = signals_2d.shape
+        out = np.empty((n_params, 4))
+
+        for i in prange(n_params):
+            pnl = np.zeros(n_bars)
+            for t in range(1, n_bars):
+                pnl[t] = signals_2d[i, t - 1] * (close[t] - close[t - 1])
+            out[i, 0], out[i, 1], out[i, 2], out[i, 3] = _fused_metrics_numba(pnl, initial_balance, rf_daily)
+        return out
+
+    @njit(cache=True)
+    def _rolling_mean_numba(values, window):
+        n = values.size
+        out = np.empty_like(values)
+        total = 0.0
+        comp = 0.0
+        for i in range(n):
+            # Kahan-compensated running sum, so add/remove round-off does not drift over long series
+            y = values[i] - comp
+            if i >= window:
+                y -= values[i - window]
+            t = total + y
+            comp = (t - total) - y
+            total = t
+            out[i] = total / window if i >= window - 1 else np.nan
+        return out
+
+    @njit(cache=True)
+    def _rolling_std_numba(values, window):
+        n = values.size
+        out = np.empty_like(values)
+        for i in range(n):
+            if i < window - 1 or window < 2:
+                out[i] = np.nan
+                continue
+            mean = 0.0
+            for j in range(i - window + 1, i + 1):
+                mean += values[j]
+            mean /= window
+            ss = 0.0
+            for j in range(i - window + 1, i + 1):
+                ss += (values[j] - mean) ** 2
+            out[i] = np.sqrt(ss / (window - 1))
+        return out
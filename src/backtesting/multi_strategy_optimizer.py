@@ -1,6 +1,47 @@
 import numpy as np
 import pandas as pd
-from itertools import product
+from itertools import islice, product
+from joblib import Parallel, delayed
+from src.backtesting.kernels import fused_metrics, price_changes, run_backtest_numpy, sweep_metrics
+
+PARAM_CHUNK_SIZE = 64  # Combinations per joblib task
+
+
+def _generate_signals(strategy, config, data):
+    """
+    Reconfigure a strategy and return its signals as an array.
+    Runs inside joblib workers, each of which holds its own copy of the strategy.
+    :param strategy: Strategy instance.
+    :param config: Parameter configuration for the strategy.
+    :param data: Preprocessed DataFrame with historical data.
+    :return: Array of trading signals (float32, exact for {-1, 0, 1}).
+    """
+    if hasattr(strategy, "reconfigure"):
+        strategy.reconfigure(config)
+    else:
+        strategy.__init__(config)  # Legacy strategies without a reconfigure hook
+    # Shallow copy: the strategy's indicator columns never land in the caller's frame
+    return strategy.generate_signals(data.copy(deep=False))["Signal"].to_numpy(dtype=np.float32)
+
+
+def _score_chunk(strategy, configs, data, initial_balance):
+    """
+    Generate and score the signals of several parameter configurations in one joblib task,
+    so the strategy and data are shipped to a worker once per chunk rather than once per combination.
+    Only the chunk's best trial leaves the worker; its signal matrix is dropped here.
+    :param strategy: Strategy instance.
+    :param configs: List of parameter configurations.
+    :param data: Preprocessed DataFrame with historical data.
+    :param initial_balance: Starting balance for each backtest.
+    :return: Tuple of (best configuration in the chunk, its metrics row).
+    """
+    signals = np.empty((len(configs), len(data)), dtype=np.float32)
+    for i, config in enumerate(configs):
+        signals[i] = _generate_signals(strategy, config, data)
+    scores = sweep_metrics(data["close"].to_numpy(dtype=np.float64), signals, initial_balance)
+    best = int(np.argmax(scores[:, 0]))
+    return configs[best], scores[best]
+
 
 class MultiStrategyOptimizer:
     """
@@ -24,16 +65,49 @@ class MultiStrategyOptimizer:
         :return: Performance metrics for the strategy.
         """
         data = strategy.generate_signals(data)
-        data["Position"] = data["Signal"].shift(1).fillna(0)
-        data["PnL"] = data["Position"] * (data["close"].diff().fillna(0))
-        data["Equity"] = self.initial_balance + data["PnL"].cumsum()
+        close, close_diff = self._precompute(data)
+        return self._full_metrics(close, close_diff, data["Signal"].to_numpy())
+
+    @staticmethod
+    def _precompute(data):
+        """
+        Extract the trial-invariant price arrays once per dataset.
+        :param data: DataFrame with a close column.
+        :return: Tuple of (close, close_diff) arrays.
+        """
+        close = data["close"].to_numpy(dtype=np.float64)
+        return close, price_changes(close)
+
+    def _quick_pnl(self, close_diff, signals_2d):
+        """
+        Total PnL of many signal series, without the other metrics.
+        Used to rank ensemble weight trials in float32; only the winner goes through _full_metrics in float64.
+        :param close_diff: Array of bar-to-bar price changes, shape (n_bars,).
+        :param signals_2d: Array of signals, shape (n_trials, n_bars).
+        :return: Array of total PnL per trial.
+        """
+        # Position at bar t is the signal of bar t-1, so the sum collapses to one mat-vec product
+        return signals_2d[:, :-1] @ close_diff[1:].astype(np.float32)
 
-        total_pnl = data["PnL"].sum()
-        returns = data["PnL"] / self.initial_balance
-        sharpe_ratio = self.calculate_sharpe_ratio(returns)
-        max_drawdown = self.calculate_max_drawdown(data["Equity"])
-        win_rate = (data["PnL"] > 0).mean()
+    def _full_metrics(self, close, close_diff, signal):
+        """
+        Backtest a single signal series and compute every reported metric.
+        :param close: Array of closing prices.
+        :param close_diff: Array of bar-to-bar price changes.
+        :param signal: Array of trading signals.
+        :return: Performance metrics.
+        """
+        _, pnl, _ = run_backtest_numpy(close, signal, self.initial_balance, close_diff=close_diff)
+        return self._metrics_dict(fused_metrics(pnl, self.initial_balance))
 
+    @staticmethod
+    def _metrics_dict(metrics):
+        """
+        Label a (total PnL, Sharpe ratio, max drawdown, win rate) row.
+        :param metrics: Sequence of the four metric values.
+        :return: Performance metrics.
+        """
+        total_pnl, sharpe_ratio, max_drawdown, win_rate = map(float, metrics)
         return {
             "Total PnL": total_pnl,
             "Sharpe Ratio": sharpe_ratio,
@@ -41,87 +115,91 @@ class MultiStrategyOptimizer:
             "Win Rate": win_rate,
         }
 
-    def optimize_parameters(self, data, strategy, param_grid):
+    def optimize_parameters(self, data, strategy, param_grid, n_jobs=-1, chunk_size=PARAM_CHUNK_SIZE):
         """
         Optimize parameters for a single strategy.
+        The grid is streamed: combinations are pulled from the product lazily, one chunk per
+        joblib task, and each chunk is generated and scored by the parallel sweep_metrics kernel
+        in its worker. Only a running best (highest total PnL) is kept, so memory stays bounded
+        by the chunks in flight rather than the size of the grid.
         :param data: Preprocessed DataFrame with historical data.
         :param strategy: Strategy instance.
         :param param_grid: Dictionary of parameters to tune.
+        :param n_jobs: Number of joblib workers used for signal generation (-1 = all cores).
+        :param chunk_size: Combinations per joblib task.
         :return: Best parameters and performance metrics.
         """
         param_names = list(param_grid.keys())
-        param_combinations = list(product(*param_grid.values()))
-        best_metrics = None
-        best_params = None
-
-        for params in param_combinations:
-            config = dict(zip(param_names, params))
-            strategy.__init__(config)  # Reinitialize strategy with new parameters
-            metrics = self.evaluate_strategy(data, strategy)
+        combos = (dict(zip(param_names, params)) for params in product(*param_grid.values()))
+        chunks = iter(lambda: list(islice(combos, chunk_size)), [])
 
-            if best_metrics is None or metrics["Total PnL"] > best_metrics["Total PnL"]:
-                best_metrics = metrics
-                best_params = config
+        # joblib consumes the task generator as workers free up (pre_dispatch)
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_score_chunk)(strategy, chunk, data, self.initial_balance) for chunk in chunks
+        )
 
-        return best_params, best_metrics
+        best_params, best_scores = None, None
+        for params, scores in results:
+            if best_scores is None or scores[0] > best_scores[0]:
+                best_params, best_scores = params, scores
+        return best_params, self._metrics_dict(best_scores)
 
     def optimize_ensemble(self, data, weights_grid):
         """
         Find the optimal weights for an ensemble of strategies.
+        Signals are generated once per strategy; every weight combination is then
+        blended with a single matrix product and ranked on total PnL.
         :param data: Preprocessed DataFrame with historical data.
-        :param weights_grid: Grid of weights to test for the ensemble.
+        :param weights_grid: Iterable of weight vectors to test for the ensemble.
         :return: Best weights and performance metrics.
         """
-        best_metrics = None
-        best_weights = None
-
-        for weights in weights_grid:
-            ensemble_signals = np.zeros(len(data))
-            for i, strategy in enumerate(self.strategies.values()):
-                strategy_signals = strategy.generate_signals(data)["Signal"]
-                ensemble_signals += weights[i] * strategy_signals
-
-            data["Ensemble_Signal"] = np.sign(ensemble_signals)
-            data["Position"] = data["Ensemble_Signal"].shift(1).fillna(0)
-            data["PnL"] = data["Position"] * (data["close"].diff().fillna(0))
-            data["Equity"] = self.initial_balance + data["PnL"].cumsum()
-
-            total_pnl = data["PnL"].sum()
-            sharpe_ratio = self.calculate_sharpe_ratio(data["PnL"] / self.initial_balance)
-            max_drawdown = self.calculate_max_drawdown(data["Equity"])
-
-            metrics = {
-                "Total PnL": total_pnl,
-                "Sharpe Ratio": sharpe_ratio,
-                "Max Drawdown": max_drawdown,
-            }
-
-            if best_metrics is None or metrics["Total PnL"] > best_metrics["Total PnL"]:
-                best_metrics = metrics
-                best_weights = weights
-
-        return best_weights, best_metrics
+        weights_grid = list(weights_grid)  # Generators are accepted; the winner is indexed below
+        # One contiguous row per strategy (SoA), so each series is streamed linearly.
+        # Each strategy works on a shallow copy: its indicator and Signal columns are added
+        # to the copy only, without duplicating the price data.
+        signals = np.vstack([
+            strategy.generate_signals(data.copy(deep=False))["Signal"].to_numpy(dtype=np.float32)
+            for strategy in self.strategies.values()
+        ])
+        weights = np.asarray(weights_grid, dtype=np.float32)
+        close, close_diff = self._precompute(data)
+
+        # (n_weights, n_strategies) @ (n_strategies, n_bars) -> one C-contiguous row per weight trial
+        # Sign is taken in place: no second n_weights x n_bars allocation
+        ensemble_signals = weights @ signals
+        np.sign(ensemble_signals, out=ensemble_signals)
+
+        best = int(np.argmax(self._quick_pnl(close_diff, ensemble_signals)))
+        metrics = self._full_metrics(close, close_diff, ensemble_signals[best])
+        best_metrics = {
+            "Total PnL": metrics["Total PnL"],
+            "Sharpe Ratio": metrics["Sharpe Ratio"],
+            "Max Drawdown": metrics["Max Drawdown"],
+        }
+        return weights_grid[best], best_metrics
 
     @staticmethod
     def calculate_sharpe_ratio(returns, risk_free_rate=0.01):
         """
         Calculate the Sharpe ratio.
-        :param returns: Series of returns.
+        :param returns: Array of returns.
         :param risk_free_rate: Risk-free rate of return.
         :return: Sharpe ratio.
         """
-        excess_returns = returns - risk_free_rate / 252
-        return excess_returns.mean() / excess_returns.std() if excess_returns.std() != 0 else 0
+        excess_returns = np.asarray(returns, dtype=np.float64) - risk_free_rate / 252
+        std = np.std(excess_returns, ddof=1)
+        return np.mean(excess_returns) / std if std != 0 else 0
 
     @staticmethod
     def calculate_max_drawdown(equity_curve):
         """
         Calculate the maximum drawdown.
-        :param equity_curve: Series of equity values over time.
+        :param equity_curve: Array of equity values over time.
         :return: Maximum drawdown as a percentage.
         """
-        peak = equity_curve.cummax()
-        drawdown = (equity_curve - peak) / peak
+        equity_curve = np.asarray(equity_curve, dtype=np.float64)
+        peak = np.maximum.accumulate(equity_curve)
+        drawdown = np.divide(equity_curve - peak, peak, out=np.zeros_like(peak), where=peak > 0)
         return drawdown.min()
 
 
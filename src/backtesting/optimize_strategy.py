@@ -1,23 +1,121 @@
 import pandas as pd
 import numpy as np
 import time
-from sklearn.model_selection import GridSearchCV, train_test_split
-from sklearn.ensemble import RandomForestClassifier
+from joblib import Memory
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401 (enables HalvingGridSearchCV)
+from sklearn.base import clone
+from sklearn.model_selection import (
+    GridSearchCV, HalvingGridSearchCV, RandomizedSearchCV, TimeSeriesSplit, cross_val_score, train_test_split
+)
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
 from sklearn.metrics import precision_score, classification_report
-from src.backtesting.prepare_date_range import preprocess_data
+from src.backtesting.backtest_runner import mean_reversion_vec, vectorize_rowwise
+from src.backtesting.kernels import total_pnl
+from src.backtesting.prepare_date_range import FEATURE_COLUMNS, preprocess_data
+from src.backtesting.streaming_indicators import StreamingIndicators
+from src.backtesting.train_model import load_model
 from src.broker import Broker
 
+try:
+    import optuna
+    OPTUNA_AVAILABLE = True
+except ImportError:
+    OPTUNA_AVAILABLE = False
+
+
+def _fit_search(search, features, target):
+    """
+    Fit a hyperparameter search. Wrapped with joblib.Memory so identical re-runs load from disk.
+    :param search: Unfitted search object.
+    :param features: Feature matrix.
+    :param target: Target vector.
+    :return: Fitted search object.
+    """
+    return search.fit(features, target)
+
+
+def _suggest(trial, name, values):
+    """
+    Turn a grid entry into an Optuna search dimension: numeric lists span their [min, max] range.
+    :param trial: Optuna trial.
+    :param name: Hyperparameter name.
+    :param values: List of candidate values from the parameter grid.
+    :return: Suggested value.
+    """
+    values = list(values)
+    numeric = all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in values)
+    if numeric and all(isinstance(v, (int, np.integer)) for v in values):
+        return trial.suggest_int(name, int(min(values)), int(max(values)))
+    if numeric:
+        low, high = float(min(values)), float(max(values))
+        return trial.suggest_float(name, low, high, log=low > 0)
+    return trial.suggest_categorical(name, values)
+
+
+def _tpe_search(model, param_grid, features, target, n_trials, cv):
+    """
+    Bayesian (TPE) hyperparameter search over the ranges spanned by param_grid.
+    Wrapped with joblib.Memory so identical re-runs load from disk.
+    :param model: Unfitted estimator used as the template for every trial.
+    :param param_grid: Dictionary of hyperparameters to tune.
+    :param features: Feature matrix.
+    :param target: Target vector.
+    :param n_trials: Number of model configurations to evaluate.
+    :param cv: Cross-validation splitter or number of folds.
+    :return: Tuple of (best parameters, best cross-validated precision).
+    """
+    def objective(trial):
+        params = {name: _suggest(trial, name, values) for name, values in param_grid.items()}
+        estimator = clone(model).set_params(**params)
+        return cross_val_score(estimator, features, target, scoring="precision", cv=cv, n_jobs=-1).mean()
+
+    study = optuna.create_study(direction="maximize", sampler=optuna.samplers.TPESampler(seed=42))
+    study.optimize(objective, n_trials=n_trials)
+    return study.best_params, study.best_value
+
+
 class StrategyOptimizer:
     """
     Class to optimize trading strategies using machine learning and real-time evaluation.
     """
 
-    def __init__(self, model=None):
+    def __init__(self, model=None, search_strategy="tpe", n_iter=10, n_trials=25, cache_dir=".cache/rf",
+                 model_path=None):
         """
         Initialize the optimizer with an ML model.
         :param model: Machine learning model for predictions.
+        :param search_strategy: "tpe" (Optuna Bayesian search, falls back to "random" without optuna),
+                                "random" (RandomizedSearchCV), "halving" (HalvingGridSearchCV)
+                                or "grid" (exhaustive GridSearchCV, for reproducibility runs).
+        :param n_iter: Number of sampled combinations for the random search.
+        :param n_trials: Number of trials for the TPE search.
+        :param cache_dir: Directory for the on-disk search cache (None disables caching).
+        :param model_path: Optional model saved by train_model; takes precedence over model.
         """
-        self.model = model if model else RandomForestClassifier(random_state=42)
+        if search_strategy not in ("tpe", "random", "halving", "grid"):
+            raise ValueError("Invalid search strategy. Choose 'tpe', 'random', 'halving' or 'grid'.")
+        if search_strategy == "tpe" and not OPTUNA_AVAILABLE:
+            search_strategy = "random"
+        self.features = list(FEATURE_COLUMNS)
+        if model_path:
+            model, self.features = load_model(model_path)
+        self.model = model if model else HistGradientBoostingClassifier(
+            max_iter=200, learning_rate=0.05, max_depth=6, early_stopping=True, random_state=42
+        )
+        self.search_strategy = search_strategy
+        self.n_iter = n_iter
+        self.n_trials = n_trials
+        self.memory = Memory(location=cache_dir, verbose=0)
+
+    @property
+    def model(self):
+        return self._model
+
+    @model.setter
+    def model(self, model):
+        # A new model invalidates every cached prediction
+        self._model = model
+        self._prediction_cache = pd.Series(dtype=np.float64)
 
     def optimize_parameters(self, data, param_grid):
         """
@@ -26,32 +124,93 @@ class StrategyOptimizer:
         :param param_grid: Dictionary of hyperparameters to tune.
         :return: Best model and parameters.
         """
-        features = data[["SMA_20", "RSI", "Normalized_Close"]]
+        features = data[self.features]
         target = data["Target"]
+        # Forward-chaining folds: every fold validates on bars after the ones it trained on
+        cv = TimeSeriesSplit(n_splits=5)
 
-        grid_search = GridSearchCV(
-            self.model,
-            param_grid,
-            scoring="precision",
-            cv=5,
-            n_jobs=-1,
-        )
-        grid_search.fit(features, target)
+        if self.search_strategy == "tpe":
+            best_params, best_score = self.memory.cache(_tpe_search)(
+                self.model, param_grid, features, target, self.n_trials, cv
+            )
+            self.model = clone(self.model).set_params(**best_params).fit(features, target)
+
+            print("Best Parameters:", best_params)
+            print("Best Score:", best_score)
+            return self.model, best_params
+
+        if self.search_strategy == "random":
+            grid_search = RandomizedSearchCV(
+                self.model,
+                param_distributions=param_grid,
+                n_iter=self.n_iter,
+                scoring="precision",
+                cv=cv,
+                n_jobs=-1,
+                random_state=42,
+            )
+        elif self.search_strategy == "halving":
+            grid_search = HalvingGridSearchCV(
+                self.model,
+                param_grid,
+                scoring="precision",
+                cv=cv,
+                n_jobs=-1,
+                random_state=42,
+            )
+        else:
+            grid_search = GridSearchCV(
+                self.model,
+                param_grid,
+                scoring="precision",
+                cv=cv,
+                n_jobs=-1,
+            )
+        grid_search = self.memory.cache(_fit_search)(grid_search, features, target)
         self.model = grid_search.best_estimator_
 
         print("Best Parameters:", grid_search.best_params_)
         print("Best Score:", grid_search.best_score_)
         return self.model, grid_search.best_params_
 
+    def retrain_incremental(self, data, extra_trees=20):
+        """
+        Grow the tree ensemble with trees fitted on new data instead of refitting it from scratch.
+        A warm-start fit takes its classes from the new chunk only, so a chunk that does not
+        contain every class the model was trained on (e.g. a quiet market) is skipped.
+        :param data: Preprocessed DataFrame with features and target.
+        :param extra_trees: Number of trees (boosting iterations for gradient boosting) to add.
+        :return: Updated model, or None when the chunk was skipped.
+        """
+        model = self.model
+        if not isinstance(model, (HistGradientBoostingClassifier, RandomForestClassifier)):
+            raise ValueError("Incremental retraining requires a HistGradientBoosting or RandomForest classifier.")
+        if not np.array_equal(np.unique(data["Target"]), model.classes_):
+            return None
+
+        if isinstance(model, HistGradientBoostingClassifier):
+            # Early stopping would validate on a handful of new rows and stop after an iteration or two.
+            # Count from the iterations actually fitted, which early stopping may have kept below max_iter.
+            early_stopping = model.early_stopping
+            model.set_params(max_iter=model.n_iter_ + extra_trees, warm_start=True, early_stopping=False)
+            model.fit(data[self.features], data["Target"])
+            model.set_params(early_stopping=early_stopping)
+        else:
+            model.set_params(n_estimators=model.n_estimators + extra_trees, warm_start=True)
+            model.fit(data[self.features], data["Target"])
+
+        self.model = model  # Goes through the setter so cached predictions are dropped
+        return model
+
     def evaluate_strategy(self, data, strategy_function):
         """
         Evaluate a given strategy and compare it with the ML model.
         :param data: Preprocessed DataFrame with market data.
-        :param strategy_function: Existing trading strategy function.
+        :param strategy_function: Existing trading strategy function (vectorized or row-wise).
         :return: Comparison of strategy vs. ML model.
         """
-        data["ML_Signal"] = self.model.predict(data[["SMA_20", "RSI", "Normalized_Close"]])
-        data["Strategy_Signal"] = data.apply(strategy_function, axis=1)
+        data["ML_Signal"] = self.model.predict(data[self.features])
+        data["Strategy_Signal"] = vectorize_rowwise(strategy_function)(data)
 
         ml_pnl = self.calculate_pnl(data, "ML_Signal")
         strategy_pnl = self.calculate_pnl(data, "Strategy_Signal")
@@ -74,28 +233,71 @@ class StrategyOptimizer:
         :param signal_column: Column name with trading signals.
         :return: Total PnL.
         """
-        data["Position"] = data[signal_column].shift(1).fillna(0)
-        data["PnL"] = data["Position"] * (data["close"].diff().fillna(0))
-        return data["PnL"].sum()
+        # Position at bar t is the signal of bar t-1; the input frame is left untouched
+        return total_pnl(data["close"].to_numpy(), data[signal_column].to_numpy(dtype=np.float64))
 
-    def real_time_optimization(self, api, strategy_function, interval=60):
+    def predict_cached(self, data):
+        """
+        Predict ML signals, reusing predictions for rows already scored on earlier ticks.
+        Rows are keyed by timestamp; only rows that are new to the buffer are sent to the model.
+        Repeated timestamps (e.g. overlapping stream and REST bars) share the prediction of their last row.
+        :param data: Preprocessed DataFrame with a timestamp column and model features.
+        :return: Array of predictions aligned with data.
+        """
+        timestamps = data["timestamp"]
+        cache = self._prediction_cache
+        cache = cache[cache.index.isin(timestamps)]  # Drop rows that have left the buffer
+
+        # One row per unseen timestamp, so the cache index stays unique and reindex never sees duplicates
+        new_rows = ~timestamps.isin(cache.index).to_numpy() & ~timestamps.duplicated(keep="last").to_numpy()
+        if new_rows.any():
+            predictions = self.model.predict(data.loc[new_rows, self.features])
+            cache = pd.concat([cache, pd.Series(predictions, index=pd.Index(timestamps[new_rows]))])
+
+        self._prediction_cache = cache
+        return cache.reindex(timestamps).to_numpy()
+
+    def real_time_optimization(self, api, strategy_function, interval=60, retrain_rows=50):
         """
         Perform real-time strategy optimization.
+        The model is grown with retrain_incremental whenever enough new bars have been labelled.
         :param api: Trading API for fetching real-time data.
-        :param strategy_function: Existing trading strategy function.
+        :param strategy_function: Existing trading strategy function (vectorized or row-wise).
         :param interval: Time interval (in seconds) for updates.
+        :param retrain_rows: Number of newly labelled bars that triggers a warm-start retrain.
         """
         broker = Broker(config={"currency": "USD", "asset": "BTC"}, api=api)
+        strategy_function = vectorize_rowwise(strategy_function)
+        indicators = StreamingIndicators()
+        buffer = None
+        trained_until = None  # Timestamp of the last bar the model was retrained on
 
         while True:
             # Fetch real-time data
             try:
                 real_time_data = broker.fetch_real_time_data()
-                processed_data = preprocess_data(real_time_data)
+                if real_time_data.empty:
+                    continue  # Nothing fetched; iloc[-0:] below would replay the whole buffer
+
+                # Only bars newer than the last tick go through the indicators
+                new_rows = indicators.update(real_time_data)
+                buffer = new_rows if buffer is None else pd.concat([buffer, new_rows], ignore_index=True)
+                buffer = buffer.iloc[-len(real_time_data):]
+                processed_data = buffer.copy()
+
+                # Bars whose next close is now known are labelled and, once enough have
+                # accumulated, added to the model as extra trees rather than a full refit
+                target = (buffer["close"].shift(-1) > buffer["close"]).astype(np.int8)
+                labelled = buffer.iloc[:-1].assign(Target=target.iloc[:-1])
+                if trained_until is not None:
+                    labelled = labelled[labelled["timestamp"] > trained_until]
+                # A skipped chunk (missing a class) stays pending and is retried with the next bars
+                if len(labelled) >= retrain_rows and self.retrain_incremental(labelled) is not None:
+                    trained_until = labelled["timestamp"].iloc[-1]
 
                 # Compare ML predictions with strategy
-                processed_data["ML_Signal"] = self.model.predict(processed_data[["SMA_20", "RSI", "Normalized_Close"]])
-                processed_data["Strategy_Signal"] = processed_data.apply(strategy_function, axis=1)
+                processed_data["ML_Signal"] = self.predict_cached(processed_data)
+                processed_data["Strategy_Signal"] = strategy_function(processed_data)
 
                 # Evaluate and log performance
                 ml_pnl = self.calculate_pnl(processed_data, "ML_Signal")
@@ -110,9 +312,9 @@ class StrategyOptimizer:
 
             except Exception as e:
                 print(f"Error in real-time optimization: {e}")
-
-            # Wait before the next iteration
-            time.sleep(interval)
+            finally:
+                # Wait before the next iteration
+                time.sleep(interval)
 
 
 if __name__ == "__main__":
@@ -122,31 +324,22 @@ if __name__ == "__main__":
     file_path = "data/historical/sample_data.csv"
     raw_data = load_historical_data(file_path)
     data = preprocess_data(raw_data)
-    data["Target"] = (data["close"].shift(-1) > data["close"]).astype(int)  # Binary classification target
+    data["Target"] = (data["close"].shift(-1) > data["close"]).astype(np.int8)  # Binary classification target
 
     # Initialize optimizer
     optimizer = StrategyOptimizer()
 
     # Define hyperparameter grid
     param_grid = {
-        "n_estimators": [50, 100, 150],
-        "max_depth": [10, 20, None],
-        "min_samples_split": [2, 5, 10],
+        "max_iter": [100, 200, 400],
+        "learning_rate": [0.03, 0.05, 0.1],
+        "max_depth": [4, 6, 8],
     }
 
     # Optimize model parameters
     print("Optimizing model parameters...")
     model, best_params = optimizer.optimize_parameters(data, param_grid)
 
-    # Define a sample strategy
-    def mean_reversion_strategy(row):
-        if row["RSI"] < 30:
-            return 1  # Buy signal
-        elif row["RSI"] > 70:
-            return -1  # Sell signal
-        else:
-            return 0  # Hold signal
-
-    # Run real-time optimization
+    # Run real-time optimization with a sample strategy (e.g., mean reversion)
     print("Starting real-time optimization...")
-    optimizer.real_time_optimization(api, mean_reversion_strategy)
+    optimizer.real_time_optimization(api, mean_reversion_vec)
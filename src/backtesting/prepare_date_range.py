@@ -1,6 +1,34 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from src.backtesting.kernels import rolling_mean, rsi_wilder
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+FEATURE_COLUMNS = ["SMA_20", "RSI", "Normalized_Close"]
+
+
+def _read_csv_arrow(file_path):
+    """
+    Read the CSV with the multi-threaded Arrow parser, price columns declared as float64.
+    The timestamp type is inferred, so naive and offset timestamps both load
+    (offset timestamps come back tz-aware in UTC).
+    :param file_path: Path to the CSV file.
+    :return: DataFrame, or None when Arrow cannot parse the file as timestamped bars.
+    """
+    column_types = {column: pa.float64() for column in PRICE_COLUMNS}
+    try:
+        table = pa_csv.read_csv(file_path, convert_options=pa_csv.ConvertOptions(column_types=column_types))
+    except pa.ArrowInvalid:
+        return None
+    if "timestamp" not in table.column_names or not pa.types.is_timestamp(table.schema.field("timestamp").type):
+        return None
+    return table.to_pandas()
 
 
 def load_historical_data(file_path):
@@ -10,8 +38,11 @@ def load_historical_data(file_path):
     :return: DataFrame containing market data.
     """
     try:
-        data = pd.read_csv(file_path, parse_dates=["timestamp"])
-        data.sort_values("timestamp", inplace=True)
+        data = _read_csv_arrow(file_path) if pa is not None else None
+        if data is None:
+            data = pd.read_csv(file_path, parse_dates=["timestamp"])
+        if not data["timestamp"].is_monotonic_increasing:
+            data.sort_values("timestamp", inplace=True)
         return data
     except Exception as e:
         raise Exception(f"Error loading historical data: {e}")
@@ -26,26 +57,32 @@ def preprocess_data(data):
     :return: Preprocessed DataFrame.
     """
     try:
-        data["SMA_20"] = data["close"].rolling(window=20).mean()
+        data["SMA_20"] = rolling_mean(data["close"].to_numpy(), 20)
         data["RSI"] = calculate_rsi(data["close"], 14)
         data["Normalized_Close"] = (data["close"] - data["close"].mean()) / data["close"].std()
-        return data.dropna()
+        return _to_float32(data.dropna())
     except Exception as e:
         raise Exception(f"Error preprocessing data: {e}")
 
 
+def _to_float32(data):
+    """
+    Cast the model feature columns to float32, the precision the tree models train on.
+    :param data: Preprocessed DataFrame.
+    :return: DataFrame with float32 feature columns.
+    """
+    return data.astype({column: np.float32 for column in FEATURE_COLUMNS})
+
+
 def calculate_rsi(prices, period=14):
     """
-    Calculate the Relative Strength Index (RSI).
+    Calculate the Relative Strength Index (RSI) with Wilder's smoothing.
+    Runs as a single compiled pass when Numba is available.
     :param prices: Series of closing prices.
     :param period: Look-back period.
     :return: Series with RSI values.
     """
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+    return pd.Series(rsi_wilder(prices.to_numpy(), period), index=prices.index)
 
 
 def split_data(data, train_ratio=0.8):
@@ -64,16 +101,17 @@ def split_data(data, train_ratio=0.8):
 def get_date_range(data, start_date=None, end_date=None):
     """
     Filter data by a specific date range.
-    :param data: DataFrame with preprocessed data.
+    Relies on the timestamp ordering established by load_historical_data, so the
+    bounds are found by binary search and the result is a positional slice.
+    :param data: DataFrame with preprocessed data, sorted by timestamp.
     :param start_date: Start date as a string (YYYY-MM-DD).
     :param end_date: End date as a string (YYYY-MM-DD).
     :return: Filtered DataFrame.
     """
-    if start_date:
-        data = data[data["timestamp"] >= pd.to_datetime(start_date)]
-    if end_date:
-        data = data[data["timestamp"] <= pd.to_datetime(end_date)]
-    return data
+    timestamps = data["timestamp"]
+    lo = timestamps.searchsorted(pd.to_datetime(start_date), side="left") if start_date else 0
+    hi = timestamps.searchsorted(pd.to_datetime(end_date), side="right") if end_date else len(data)
+    return data.iloc[lo:hi]
 
 
 if __name__ == "__main__":
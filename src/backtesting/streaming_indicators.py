@@ -0,0 +1,99 @@
+import collections
+import math
+import numpy as np
+import pandas as pd
+from src.backtesting.prepare_date_range import FEATURE_COLUMNS
+
+
+class StreamingIndicators:
+    """
+    Maintains the preprocess_data features (SMA_20, RSI, Normalized_Close) incrementally,
+    so each new bar costs O(1) instead of a recomputation over the whole window.
+    Normalized_Close uses the running mean/std of every close seen so far (Welford),
+    rather than the statistics of the full frame.
+    """
+
+    def __init__(self, sma_window=20, rsi_period=14):
+        """
+        Initialize the indicator state.
+        :param sma_window: Window length of the simple moving average.
+        :param rsi_period: Look-back period of Wilder's RSI.
+        """
+        self.sma_window = sma_window
+        self.rsi_period = rsi_period
+        self.last_timestamp = None
+
+        self._window = collections.deque(maxlen=sma_window)
+        self._sma_sum = 0.0
+        self._prev_close = None
+        self._n_deltas = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._count = 0
+        self._close_mean = 0.0
+        self._close_m2 = 0.0
+
+    def update(self, bars):
+        """
+        Feed new bars through the indicators.
+        :param bars: DataFrame with timestamp and close columns, sorted by timestamp.
+                     Bars at or before the last processed timestamp are skipped.
+        :return: DataFrame with the new bars whose indicators are warmed up, features as float32.
+        """
+        if self.last_timestamp is not None:
+            bars = bars[bars["timestamp"] > self.last_timestamp]
+
+        closes = bars["close"].to_numpy(dtype=np.float64)
+        features = np.full((len(closes), len(FEATURE_COLUMNS)), np.nan)
+        for i, close in enumerate(closes):
+            features[i] = self._step(close)
+
+        if len(closes):
+            self.last_timestamp = bars["timestamp"].iloc[-1]
+
+        ready = ~np.isnan(features).any(axis=1)
+        new_rows = bars[ready].copy()
+        for j, column in enumerate(FEATURE_COLUMNS):
+            new_rows[column] = features[ready, j].astype(np.float32)
+        return new_rows
+
+    def _step(self, close):
+        """
+        Advance every indicator by one bar.
+        :param close: Closing price of the new bar.
+        :return: Tuple of (SMA_20, RSI, Normalized_Close), NaN while warming up.
+        """
+        # Sliding-window sum for the SMA
+        if len(self._window) == self.sma_window:
+            self._sma_sum -= self._window[0]
+        self._window.append(close)
+        self._sma_sum += close
+
+        # Wilder's RSI: simple average over the first period, then the smoothing recurrence
+        period = self.rsi_period
+        if self._prev_close is not None:
+            delta = close - self._prev_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            self._n_deltas += 1
+            if self._n_deltas <= period:
+                self._avg_gain += gain / period
+                self._avg_loss += loss / period
+            else:
+                self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+                self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+        self._prev_close = close
+
+        # Welford's online mean/variance for normalization
+        self._count += 1
+        delta = close - self._close_mean
+        self._close_mean += delta / self._count
+        self._close_m2 += delta * (close - self._close_mean)
+
+        if len(self._window) < self.sma_window or self._n_deltas < period or self._count < 2:
+            return np.nan, np.nan, np.nan
+
+        sma = self._sma_sum / self.sma_window
+        rsi = 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss) if self._avg_loss > 0 else 100.0
+        std = math.sqrt(self._close_m2 / (self._count - 1))
+        normalized = (close - self._close_mean) / std if std > 0 else 0.0
+        return sma, rsi, normalized
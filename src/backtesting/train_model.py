@@ -1,8 +1,12 @@
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
 import joblib
+from src.backtesting.backtest_runner import mean_reversion_vec, vectorize_rowwise
+from src.backtesting.kernels import total_pnl
+from src.backtesting.prepare_date_range import FEATURE_COLUMNS
 
 def load_and_preprocess_data(file_path):
     """
@@ -14,7 +18,7 @@ def load_and_preprocess_data(file_path):
 
     raw_data = load_historical_data(file_path)
     data = preprocess_data(raw_data)
-    data["Target"] = (data["close"].shift(-1) > data["close"]).astype(int)  # 1 = Buy, 0 = Hold/Sell
+    data["Target"] = (data["close"].shift(-1) > data["close"]).astype(np.int8)  # 1 = Buy, 0 = Hold/Sell
     return data.dropna()
 
 
@@ -25,12 +29,17 @@ def train_model(data, output_path="models/trading_model.pkl"):
     :param output_path: Path to save the trained model.
     :return: Trained model and performance metrics.
     """
-    features = data[["SMA_20", "RSI", "Normalized_Close"]]
+    features = data[FEATURE_COLUMNS]
     target = data["Target"]
 
-    X_train, X_test, y_train, y_test = train_test_split(features, target, test_size=0.2, random_state=42)
+    # Chronological split: train on everything before the last fold and test on the last fold
+    train_idx, test_idx = list(TimeSeriesSplit(n_splits=5).split(features))[-1]
+    X_train, X_test = features.iloc[train_idx], features.iloc[test_idx]
+    y_train, y_test = target.iloc[train_idx], target.iloc[test_idx]
 
-    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    model = HistGradientBoostingClassifier(
+        max_iter=200, learning_rate=0.05, max_depth=6, early_stopping=True, random_state=42
+    )
     model.fit(X_train, y_train)
 
     # Evaluate performance
@@ -46,26 +55,45 @@ def train_model(data, output_path="models/trading_model.pkl"):
     print("\nClassification Report:")
     print(classification_report(y_test, y_pred))
 
-    # Save the model
-    joblib.dump(model, output_path)
+    # Save the model with its feature order, so prediction paths don't rely on a hard-coded list
+    joblib.dump({"model": model, "features": FEATURE_COLUMNS}, output_path, compress=3, protocol=5)
     print(f"Model saved to {output_path}")
 
     return model, {"Accuracy": accuracy, "Precision": precision, "Recall": recall}
 
 
-def recommend_strategy_changes(model, backtest_data, strategy_function):
+def load_model(model_path):
+    """
+    Load a model saved by train_model.
+    :param model_path: Path to the saved model.
+    :return: Tuple of (model, list of feature columns in training order).
+    """
+    artifact = joblib.load(model_path)
+    if isinstance(artifact, dict):
+        return artifact["model"], list(artifact["features"])
+    return artifact, list(FEATURE_COLUMNS)  # Bare model saved before the feature list was stored
+
+
+def recommend_strategy_changes(model, backtest_data, strategy_function, threshold=0.5):
     """
     Compare model predictions with a strategy and recommend changes.
     :param model: Trained machine learning model.
     :param backtest_data: Historical data for backtesting.
-    :param strategy_function: Existing strategy function.
+    :param strategy_function: Existing strategy function (vectorized or row-wise).
+    :param threshold: Probability above which the model signals a buy.
     :return: Recommendations for strategy improvements.
     """
-    backtest_data["Model_Signal"] = model.predict(backtest_data[["SMA_20", "RSI", "Normalized_Close"]])
-    backtest_data["Strategy_Signal"] = backtest_data.apply(strategy_function, axis=1)
+    features = backtest_data[FEATURE_COLUMNS]
+    if hasattr(model, "predict_proba"):
+        backtest_data["Model_Signal"] = (model.predict_proba(features)[:, 1] > threshold).astype(np.int8)
+    else:
+        backtest_data["Model_Signal"] = model.predict(features)
+    backtest_data["Strategy_Signal"] = vectorize_rowwise(strategy_function)(backtest_data)
 
-    model_pnl = calculate_pnl(backtest_data, "Model_Signal")
-    strategy_pnl = calculate_pnl(backtest_data, "Strategy_Signal")
+    # Both PnLs in one matrix-vector pass: position at bar t is the signal of bar t-1
+    signals = backtest_data[["Model_Signal", "Strategy_Signal"]].to_numpy(dtype=np.float64)
+    pnls = signals[:-1].T @ np.diff(backtest_data["close"].to_numpy(dtype=np.float64))
+    model_pnl, strategy_pnl = float(pnls[0]), float(pnls[1])
 
     print("\nPerformance Comparison:")
     print(f"ML Model PnL: {model_pnl}")
@@ -90,9 +118,8 @@ def calculate_pnl(data, signal_column):
     :param signal_column: Column name with trading signals.
     :return: Total PnL.
     """
-    data["Position"] = data[signal_column].shift(1).fillna(0)
-    data["PnL"] = data["Position"] * (data["close"].diff().fillna(0))
-    return data["PnL"].sum()
+    # Position at bar t is the signal of bar t-1; the input frame is left untouched
+    return total_pnl(data["close"].to_numpy(), data[signal_column].to_numpy(dtype=np.float64))
 
 
 if __name__ == "__main__":
@@ -103,15 +130,6 @@ if __name__ == "__main__":
     # Train the model
     model, metrics = train_model(data)
 
-    # Define an example strategy (e.g., mean reversion)
-    def mean_reversion_strategy(row):
-        if row["RSI"] < 30:
-            return 1  # Buy signal
-        elif row["RSI"] > 70:
-            return -1  # Sell signal
-        else:
-            return 0  # Hold signal
-
-    # Recommend strategy changes based on backtesting
-    recommendations = recommend_strategy_changes(model, data, mean_reversion_strategy)
+    # Recommend strategy changes based on backtesting with an example strategy (e.g., mean reversion)
+    recommendations = recommend_strategy_changes(model, data, mean_reversion_vec)
     print("Recommendations:", recommendations)
@@ -1,6 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from src.portfolio_manager import Portfolio
-from src.exchange_utils import isValidOrder, bindAll, retry
+from src.exchange_utils import isValidOrder, retry
 import time
 
 
@@ -13,7 +14,6 @@ class Broker:
 
         if config.get("private"):
             self.portfolio = Portfolio(config, api)
-        bindAll(self)
 
     def can_trade(self):
         # Check if trading is possible
@@ -41,8 +41,16 @@ class Broker:
             self.portfolio.set_fee,
             self.portfolio.set_balances,
         ]
-        for task in tasks:
-            retry(task)
+        if not self.config.get("parallel_sync", True):
+            for task in tasks:
+                retry(task)
+            return
+
+        # Independent network round-trips: overlap them so the sync takes ~max(RTT), not sum(RTT)
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(retry, task) for task in tasks]
+            for future in futures:
+                future.result()
 
     def set_ticker(self):
         """Fetch the latest ticker data."""
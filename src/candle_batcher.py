@@ -19,19 +19,25 @@ class CandleBatcher:
         :param candles: DataFrame with raw candle data (timestamp, open, high, low, close, volume).
         :return: DataFrame with aggregated candles.
         """
-        candles["timestamp"] = pd.to_datetime(candles["timestamp"])
-        candles.set_index("timestamp", inplace=True)
-
-        ohlc_dict = {
-            "open": "first",
-            "high": "max",
-            "low": "min",
-            "close": "last",
-            "volume": "sum",
-        }
-
-        aggregated = candles.resample(f"{self.target_interval}T").agg(ohlc_dict).dropna()
-        return aggregated.reset_index()
+        timestamps = pd.to_datetime(candles["timestamp"])
+        interval_ns = self.target_interval * 60 * 1_000_000_000
+        # Integer bucket ids: one Cython groupby instead of resample's DatetimeIndex bookkeeping
+        bucket = timestamps.to_numpy("datetime64[ns]").view("i8") // interval_ns
+        grouped = candles.groupby(bucket)
+
+        aggregated = pd.DataFrame({
+            "open": grouped["open"].first(),
+            "high": grouped["high"].max(),
+            "low": grouped["low"].min(),
+            "close": grouped["close"].last(),
+            "volume": grouped["volume"].sum(),
+        }).dropna()
+
+        bucket_start = pd.to_datetime(aggregated.index.to_numpy() * interval_ns)
+        if timestamps.dt.tz is not None:
+            bucket_start = bucket_start.tz_localize("UTC").tz_convert(timestamps.dt.tz)
+        aggregated.insert(0, "timestamp", bucket_start)
+        return aggregated.reset_index(drop=True)
 
 if __name__ == "__main__":
     # Example usage
@@ -1,32 +1,86 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import heapq
 import json
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
 from alpaca_trade_api import REST
+from alpaca_trade_api.stream import Stream
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from src.machine_learning.sentiment_model import SentimentModel
 from src.machine_learning.lstm_model import LSTMModel
 from src.machine_learning.random_forest import RandomForestModel
 from src.plugins import sentiment_plugin, hft_plugin
 from src.portfolio_manager import Portfolio
 
+try:
+    from orjson import loads as json_loads  # C parser, several times faster than json
+except ImportError:
+    json_loads = json.loads
+
 # Load Configuration
 @st.cache_resource
 def load_config():
     try:
-        with open("config/config.json") as f:
-            return json.load(f)
+        return json_loads(Path("config/config.json").read_bytes())
     except FileNotFoundError:
         st.error("Configuration file missing")
         st.stop()
 
 config = load_config()
 
+# Shared Alpaca client: one HTTP session/connection pool per process, reused across reruns and users
+@st.cache_resource
+def get_api():
+    return REST(config["API_KEY"], config["SECRET_KEY"], config["BASE_URL"], api_version="v2")
+
+class LivePriceFeed:
+    """Last trade price per symbol, kept current by an Alpaca WebSocket stream on a background thread"""
+
+    def __init__(self):
+        self._stream = Stream(config["API_KEY"], config["SECRET_KEY"], base_url=config["BASE_URL"],
+                              data_feed=config.get("DATA_FEED", "iex"))
+        self._prices = {}
+        self._lock = threading.Lock()
+        self._subscribe_lock = threading.Lock()  # Guards _subscribed and the stream thread start
+        self._subscribed = set()
+        self._thread = None
+
+    async def _on_trade(self, trade):
+        with self._lock:
+            self._prices[trade.symbol] = float(trade.price)
+
+    def subscribe(self, symbols):
+        """Subscribe to trades for any symbols not yet streamed; starts the stream on first use"""
+        with self._subscribe_lock:
+            new_symbols = set(symbols) - self._subscribed
+            if not new_symbols:
+                return
+            self._subscribed |= new_symbols
+            self._stream.subscribe_trades(self._on_trade, *new_symbols)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._stream.run, daemon=True)
+                self._thread.start()
+
+    def snapshot(self):
+        """Copy of the latest streamed prices"""
+        with self._lock:
+            return dict(self._prices)
+
+# One stream per process, shared by every session
+@st.cache_resource
+def get_price_feed():
+    return LivePriceFeed()
+
 # Initialize Core Components
 @st.cache_resource
 def initialize_components():
     try:
-        api = REST(config["API_KEY"], config["SECRET_KEY"], config["BASE_URL"])
+        api = get_api()
         portfolio = Portfolio(config, api)
         hft = hft_plugin.HFTPlugin(config, api)
         
@@ -54,17 +108,22 @@ api, portfolio, hft_plugin, sentiment_model, rf_model, lstm_model = initialize_c
 def get_realtime_data():
     """Fetch and process real-time trading data"""
     try:
-        # Portfolio Metrics
-        account = api.get_account()
-        positions = api.list_positions()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Portfolio Metrics: the account request is in flight while positions are listed;
+            # the bars request below needs the positions, so it stays on this thread
+            account_future = executor.submit(api.get_account)
+            positions = api.list_positions()
+            
+            # Market Data: one multi-symbol request instead of one round-trip per symbol
+            # Top 5 positions by market value, selected in O(n log 5) without sorting them all
+            top_positions = heapq.nlargest(5, positions, key=lambda pos: abs(float(pos.market_value)))
+            symbols = [pos.symbol for pos in top_positions]
+            bars = dict(api.get_latest_bars(symbols)) if symbols else {}
+            account = account_future.result()
         
         # Strategy Performance
         strategy_metrics = hft_plugin.performance_metrics
         
-        # Market Data
-        symbols = [pos.symbol for pos in positions][:5]  # Top 5 positions
-        bars = {sym: api.get_latest_bar(sym) for sym in symbols}
-        
         return {
             "equity": float(account.equity),
             "buying_power": float(account.buying_power),
@@ -80,51 +139,173 @@ def get_realtime_data():
         st.error(f"Data fetch error: {e}")
         return {}
 
+@st.cache_data(ttl=3600)
+def get_market_clock():
+    """Market clock snapshot; the next open/close times let is_market_open work without a request"""
+    clock = api.get_clock()
+    return clock.is_open, pd.Timestamp(clock.next_open), pd.Timestamp(clock.next_close)
+
+def is_market_open():
+    """Market status computed locally from the cached clock (at most one state change per snapshot hour)"""
+    was_open, next_open, next_close = get_market_clock()
+    now = pd.Timestamp.now(tz="UTC")
+    return now < next_close and (was_open or now >= next_open)
+
+@st.cache_data(ttl=60)
+def get_equity_history():
+    """Portfolio equity history, shared across reruns for a minute"""
+    return portfolio.get_equity_history()
+
+@st.cache_resource
+def get_sentiment_plugin():
+    """One sentiment plugin per process, so its in-memory and on-disk score caches are reused"""
+    return sentiment_plugin.SentimentPlugin()
+
+def get_sentiment_score(symbol):
+    """Sentiment score for a symbol; the plugin's file cache bounds its age to SENTIMENT_TTL_SECONDS"""
+    return get_sentiment_plugin().analyze_sentiment(symbol)
+
+@st.cache_data(ttl=3600, max_entries=1)
+def get_feature_importance():
+    """Random Forest feature importance; only changes when the model is reloaded"""
+    return rf_model.get_feature_importance()
+
+@st.cache_data(ttl=10)
+def get_positions_table():
+    """Position breakdown, built once per real-time data refresh instead of on every rerun"""
+    positions = get_realtime_data().get('positions', [])
+    n = len(positions)
+    # Column arrays straight from the position attributes, no per-row dicts
+    entry = np.fromiter((float(pos.avg_entry_price) for pos in positions), dtype=np.float64, count=n)
+    current = np.fromiter((float(pos.current_price) for pos in positions), dtype=np.float64, count=n)
+    return pd.DataFrame({
+        'Symbol': [pos.symbol for pos in positions],
+        'Shares': np.fromiter((int(pos.qty) for pos in positions), dtype=np.int64, count=n),
+        'Entry Price': entry,
+        'Current Price': current,
+        'P/L%': (current - entry) / entry * 100,
+    })
+
+def force_refresh():
+    """Drop the cached API data; the button click itself already triggers the rerun"""
+    get_realtime_data.clear()
+    get_positions_table.clear()
+    get_equity_history.clear()
+    get_market_clock.clear()
+
+def parallel_fetch():
+    """Run the independent page-level fetches concurrently, so a cold render waits for the slowest one, not the sum"""
+    fetches = {
+        "realtime": get_realtime_data,
+        "equity_history": get_equity_history,
+        "market_open": is_market_open,
+    }
+    # Worker threads need the script context to use st.cache_data and st.error
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=len(fetches), initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        futures = {name: executor.submit(fetch) for name, fetch in fetches.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+def apply_live_prices(pos_df):
+    """Overlay streamed last-trade prices on the cached position table"""
+    feed = get_price_feed()
+    feed.subscribe(pos_df['Symbol'])
+    live = pos_df['Symbol'].map(feed.snapshot())
+    if live.isna().all():
+        return pos_df
+    pos_df = pos_df.assign(**{'Current Price': live.fillna(pos_df['Current Price'])})
+    pos_df['P/L%'] = (pos_df['Current Price'] - pos_df['Entry Price']) / pos_df['Entry Price'] * 100
+    return pos_df
+
+# Widget Fragments: interacting with these reruns only the fragment, not the data fetches
+@st.fragment
+def trading_controls():
+    """Sidebar trading controls; values are kept in st.session_state under their keys"""
+    st.toggle("Auto Trading", value=True, key="auto_trading")
+    st.slider("Risk Level", 1, 5, 3, key="risk_level")
+
+@st.fragment(run_every="1s")
+def position_breakdown():
+    """Position table repainted every second from the cached table and the live price feed"""
+    pos_df = apply_live_prices(get_positions_table())
+    st.dataframe(pos_df.style.format({'P/L%': '{:.2f}%'}), use_container_width=True)
+
+@st.fragment
+def sentiment_panel(symbols):
+    """Sentiment lookup; switching symbols only reruns this panel"""
+    symbol = st.selectbox("Select Symbol", symbols)
+    if symbol:
+        sentiment = get_sentiment_score(symbol)
+        st.write(f"Sentiment Score: {sentiment:.2f}")
+        st.progress(sentiment, text="Market Sentiment")
+
 # Visualization Components
+def get_session_figure(key, build):
+    """Figure built once per session and kept in st.session_state; callers only swap its trace data"""
+    if key not in st.session_state:
+        st.session_state[key] = build()
+    return st.session_state[key]
+
 def display_strategy_performance(metrics):
     """Interactive strategy performance visualization"""
-    df = pd.DataFrame.from_dict(metrics, orient='index')
-    df.reset_index(inplace=True)
-    df.columns = ['Strategy', 'Success Rate']
-    
-    fig = px.bar(df, x='Strategy', y='Success Rate', 
-                title='Strategy Performance (24h Success Rate)',
-                color='Success Rate', color_continuous_scale='Viridis')
+    fig = get_session_figure('strategy_fig', lambda: go.Figure(
+        go.Bar(marker=dict(colorscale='Viridis', showscale=True, colorbar=dict(title='Success Rate'))),
+        layout=dict(title='Strategy Performance (24h Success Rate)',
+                    xaxis_title='Strategy', yaxis_title='Success Rate')))
+    rates = list(metrics.values())
+    with fig.batch_update():
+        fig.data[0].x = list(metrics)
+        fig.data[0].y = rates
+        fig.data[0].marker.color = rates
     st.plotly_chart(fig, use_container_width=True)
 
 def display_volatility_heatmap(data):
     """Volatility visualization for current positions"""
-    df = pd.DataFrame([{
-        'Symbol': sym,
-        'ATR': data[sym]['atr'],
-        'Price': data[sym]['last_price']
-    } for sym in data])
-    
-    fig = px.scatter(df, x='Symbol', y='ATR', size='Price',
-                    title='Volatility Analysis (ATR vs Price)',
-                    color='ATR', hover_data=['Price'])
+    n = len(data)
+    # Column arrays instead of one dict per symbol, written straight into the cached trace
+    atr = np.fromiter((stats['atr'] for stats in data.values()), dtype=np.float64, count=n)
+    price = np.fromiter((stats['last_price'] for stats in data.values()), dtype=np.float64, count=n)
+
+    fig = get_session_figure('volatility_fig', lambda: go.Figure(
+        go.Scatter(mode='markers', hovertemplate='%{x}<br>ATR=%{y}<br>Price=%{marker.size}<extra></extra>',
+                   marker=dict(sizemode='area', showscale=True, colorbar=dict(title='ATR'))),
+        layout=dict(title='Volatility Analysis (ATR vs Price)', xaxis_title='Symbol', yaxis_title='ATR')))
+    with fig.batch_update():
+        fig.data[0].x = list(data)
+        fig.data[0].y = atr
+        fig.data[0].marker.color = atr
+        fig.data[0].marker.size = price
+        # Same bubble scaling as plotly.express: the largest price maps to a 20px marker
+        fig.data[0].marker.sizeref = 2.0 * price.max() / 20 ** 2 if n and price.max() > 0 else 1
     st.plotly_chart(fig, use_container_width=True)
 
-def display_ml_insights():
-    """Machine learning model insights"""
+@st.cache_data(ttl=3600)
+def get_model_accuracy_table():
+    """Model accuracy table, built once an hour instead of on every rerun"""
     # Model accuracy data (example - integrate real metrics)
-    accuracy_data = {
+    now = datetime.now()
+    return pd.DataFrame({
         'Model': ['Random Forest', 'LSTM', 'Sentiment'],
         'Accuracy': [0.82, 0.78, 0.75],
-        'Last Retrained': [datetime.now() - timedelta(hours=12),
-                          datetime.now() - timedelta(hours=6),
-                          datetime.now() - timedelta(days=1)]
-    }
-    
+        'Last Retrained': [now - timedelta(hours=12),
+                          now - timedelta(hours=6),
+                          now - timedelta(days=1)]
+    })
+
+def display_ml_insights():
+    """Machine learning model insights"""
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Model Performance")
-        st.dataframe(pd.DataFrame(accuracy_data), hide_index=True)
+        st.dataframe(get_model_accuracy_table(), hide_index=True)
     
     with col2:
         st.subheader("Feature Importance")
-        features = rf_model.get_feature_importance()  # Requires method in model class
-        fig = px.pie(names=features.index, values=features.values)
+        features = get_feature_importance()  # Requires method in model class
+        fig = get_session_figure('feature_importance_fig', lambda: go.Figure(go.Pie()))
+        with fig.batch_update():
+            fig.data[0].labels = features.index
+            fig.data[0].values = features.values
         st.plotly_chart(fig, use_container_width=True)
 
 # Dashboard Layout
@@ -134,11 +315,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+fetched = parallel_fetch()
+positions_table = get_positions_table()  # Shared by every section that needs the positions
+
 # Sidebar Controls
 with st.sidebar:
     st.header("Trading Controls")
-    auto_trading = st.toggle("Auto Trading", value=True)
-    risk_level = st.slider("Risk Level", 1, 5, 3)
+    trading_controls()
     st.write(f"Current Mode: {'HFT' if hft_plugin.hft_settings['enabled'] else 'Standard'}")
     st.progress(hft_plugin.trade_count / hft_plugin.trade_limit, 
                text=f"HFT Trades: {hft_plugin.trade_count}/{hft_plugin.trade_limit}")
@@ -150,15 +333,15 @@ with tab1:
     col1, col2 = st.columns([3, 1])
     with col1:
         st.subheader("Equity Curve")
-        equity_history = portfolio.get_equity_history()  # Requires method in Portfolio
-        st.line_chart(equency_history.set_index('timestamp'))
+        equity_history = fetched["equity_history"]  # Requires method in Portfolio
+        st.line_chart(equity_history.set_index('timestamp'))
         
     with col2:
         st.subheader("Quick Stats")
-        data = get_realtime_data()
+        data = fetched["realtime"]
         st.metric("Total Equity", f"${data.get('equity', 0):,.2f}")
         st.metric("Available Liquidity", f"${data.get('buying_power', 0):,.2f}")
-        st.metric("Active Positions", len(data.get('positions', [])))
+        st.metric("Active Positions", len(positions_table))
 
 with tab2:
     st.subheader("Strategy Performance")
@@ -168,31 +351,19 @@ with tab2:
     display_volatility_heatmap(data.get('hft_stats', {}).get('volatility', {}))
     
     st.subheader("Position Breakdown")
-    pos_df = pd.DataFrame([{
-        'Symbol': pos.symbol,
-        'Shares': int(pos.qty),
-        'Entry Price': float(pos.avg_entry_price),
-        'Current Price': float(pos.current_price),
-        'P/L%': (float(pos.current_price) - float(pos.avg_entry_price)) / float(pos.avg_entry_price) * 100
-    } for pos in data.get('positions', [])])
-    st.dataframe(pos_df.style.format({'P/L%': '{:.2f}%'}), use_container_width=True)
+    position_breakdown()
 
 with tab3:
     display_ml_insights()
     st.subheader("Sentiment Analysis")
-    symbol = st.selectbox("Select Symbol", [pos.symbol for pos in data.get('positions', [])])
-    if symbol:
-        sentiment = sentiment_plugin.analyze_sentiment(symbol)
-        st.write(f"Sentiment Score: {sentiment:.2f}")
-        st.progress(sentiment, text="Market Sentiment")
+    sentiment_panel(positions_table['Symbol'].tolist())
 
 # Real-Time Updates
 st.sidebar.header("System Health")
 with st.sidebar:
     st.write(f"Last Update: {datetime.now().strftime('%H:%M:%S')}")
-    if st.button("Force Refresh"):
-        st.rerun()
-    st.write("API Status: ✔️ Connected" if api.get_clock().is_open else "❌ Disconnected")
+    st.button("Force Refresh", on_click=force_refresh)
+    st.write("API Status: ✔️ Connected" if fetched["market_open"] else "❌ Disconnected")
     st.write(f"Model Versions: LSTM v{lstm_model.version} | RF v{rf_model.version}")
 
 # Error Handling
@@ -1,43 +1,108 @@
+import asyncio
+import collections
+import json
 import logging
+import queue
 import threading
 from time import sleep
 from datetime import datetime
-import websocket
+import websockets
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 class DataStream:
     """
     Manages real-time market data streaming.
     Supports subscribing to market data and dispatching updates to consumers.
+    The connection runs on its own asyncio event loop (uvloop when installed) in a background thread.
+    Messages are buffered and dispatched in batches on a dedicated thread, so slow consumers never
+    stall the reader. Plain consumers are still called once per raw message; batched consumers
+    receive each batch as a list of decoded JSON messages.
+    All outbound messages go through send(), which encodes them as JSON with orjson (json fallback);
+    never send str(dict), which is a Python repr the exchange rejects.
     """
 
-    def __init__(self, api_url, symbols, interval=1):
+    def __init__(self, api_url, symbols, interval=1, batch_size=64, flush_interval=0.005):
         """
         Initialize the DataStream.
         :param api_url: WebSocket API URL for market data.
         :param symbols: List of market symbols to subscribe to.
         :param interval: Update interval in seconds.
+        :param batch_size: Number of buffered messages that triggers a dispatch.
+        :param flush_interval: Maximum time in seconds a message waits in the buffer.
         """
         self.api_url = api_url
         self.symbols = symbols
         self.interval = interval
         self.ws = None
         self.running = False
+        self._loop = None
         self.consumers = []
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = collections.deque()
+        self._buffer_lock = threading.Lock()
+        self._batches = queue.Queue()  # Consumed in order by the single dispatcher thread
+        self._pending = None  # asyncio.Event set while the buffer holds messages, created on the loop
 
     def connect(self):
         """
         Connect to the WebSocket server.
         """
-        self.ws = websocket.WebSocketApp(
-            self.api_url,
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close
-        )
-        self.ws.on_open = self.on_open
-        threading.Thread(target=self.ws.run_forever, daemon=True).start()
+        self.running = True
+        threading.Thread(target=self._run_loop, daemon=True).start()
+        threading.Thread(target=self._dispatch_loop, daemon=True).start()
 
-    def on_open(self):
+    def _run_loop(self):
+        """
+        Run the receive loop on a dedicated event loop in the current (background) thread.
+        """
+        self._loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self.run())
+        finally:
+            self._loop.close()
+
+    async def run(self):
+        """
+        Open the connection, subscribe, and feed every decoded message to on_message until closed.
+        """
+        self._pending = asyncio.Event()
+        flush_timer = asyncio.ensure_future(self._flush_timer())
+        try:
+            async with websockets.connect(self.api_url, max_queue=1024, compression=None) as ws:
+                self.ws = ws
+                await self.on_open()
+                async for raw in ws:
+                    self.on_message(raw)
+        except Exception as e:
+            self.on_error(e)
+        finally:
+            flush_timer.cancel()
+            self.ws = None
+            self.on_close()
+
+    async def _flush_timer(self):
+        """
+        Flush a partial batch flush_interval after its first message arrived.
+        Sleeps on an event while the buffer is empty, so an idle stream causes no wakeups.
+        """
+        while True:
+            await self._pending.wait()
+            await asyncio.sleep(self.flush_interval)
+            self._pending.clear()
+            self.flush()
+
+    async def on_open(self):
         """
         Callback when the WebSocket connection is opened.
         Subscribes to the specified symbols.
@@ -47,16 +112,60 @@ class DataStream:
             "type": "subscribe",
             "channels": [{"name": "ticker", "product_ids": self.symbols}]
         }
-        self.ws.send(str(subscription_message))
+        await self.send(subscription_message)
+
+    async def send(self, message):
+        """
+        Encode a message as JSON and send it as a text frame.
+        :param message: JSON-serializable message (typically a dict).
+        """
+        payload = orjson.dumps(message).decode() if orjson else json.dumps(message)
+        await self.ws.send(payload)
 
     def on_message(self, message):
         """
-        Callback for handling incoming messages.
+        Callback for handling incoming messages, run on the event loop.
+        Buffers the message and dispatches the batch once it is full; partial batches
+        are flushed by _flush_timer.
         :param message: The incoming WebSocket message.
         """
-        logging.info(f"Received message: {message}")
-        for consumer in self.consumers:
-            consumer(message)
+        logging.debug(f"Received message: {message}")
+        with self._buffer_lock:
+            self._buffer.append(message)
+            size = len(self._buffer)
+        if size == 1:
+            self._pending.set()
+        if size >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Hand all buffered messages to the dispatcher thread as one batch.
+        """
+        with self._buffer_lock:
+            if not self._buffer:
+                return
+            batch = list(self._buffer)
+            self._buffer.clear()
+        self._batches.put(batch)
+
+    def _dispatch_loop(self):
+        """
+        Deliver queued batches to the consumers, in arrival order, until stop() enqueues None.
+        """
+        while (batch := self._batches.get()) is not None:
+            decoded = None
+            for consumer, batched in self.consumers:
+                try:
+                    if batched:
+                        if decoded is None:
+                            decoded = [orjson.loads(m) if orjson else json.loads(m) for m in batch]
+                        consumer(decoded)
+                    else:
+                        for message in batch:
+                            consumer(message)
+                except Exception as e:
+                    logging.error(f"Consumer error: {e}")
 
     def on_error(self, error):
         """
@@ -69,22 +178,26 @@ class DataStream:
         """
         Callback for handling connection closure.
         """
+        self.flush()
         logging.info("WebSocket connection closed.")
 
-    def add_consumer(self, consumer):
+    def add_consumer(self, consumer, batched=False):
         """
         Add a consumer function to process incoming data.
-        :param consumer: Callable to process data.
+        :param consumer: Callable receiving each raw message, or a list of decoded messages if batched.
+        :param batched: Whether the consumer takes whole batches of decoded messages.
         """
-        self.consumers.append(consumer)
+        self.consumers.append((consumer, batched))
 
     def stop(self):
         """
         Stop the WebSocket connection.
         """
         self.running = False
-        if self.ws:
-            self.ws.close()
+        if self.ws and self._loop and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self.ws.close(), self._loop)
+        self.flush()
+        self._batches.put(None)  # Dispatcher exits once the remaining batches are delivered
 
 if __name__ == "__main__":
     # Example usage
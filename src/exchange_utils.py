@@ -1,24 +1,64 @@
+import json
 import time
 import logging
 import functools
 from datetime import datetime, timedelta
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from pathlib import Path
 from typing import Callable, Optional, Dict, Any
 
+try:
+    from orjson import loads as json_loads  # C parser, several times faster than json
+except ImportError:
+    json_loads = json.loads
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+CACHE_MAXSIZE = 4096
+_MISSING = object()
+
+
+class _LRUTTLCache:
+    """Minimal stand-in for cachetools.TTLCache: LRU-bounded, entries expire on the monotonic clock."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        if time.monotonic() >= item[0]:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return item[1]
+
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
 class ExchangeUtils:
     def __init__(self, config_path="config/config.json"):
         self.config = self._load_config(config_path)
         self.rate_limits = self.config.get("rate_limits", {})
         self.request_history = defaultdict(deque)
-        self.cache = {}
+        self.cache = {}  # ttl -> bounded TTL cache shared by every decorated function with that ttl
         self.last_error_time = None
         self.error_count = 0
         
     def _load_config(self, config_path):
         """Load configuration from JSON file"""
         try:
-            with open(config_path) as f:
-                return json.load(f)
+            return json_loads(Path(config_path).read_bytes())
         except Exception as e:
             logging.error(f"Error loading config: {e}")
             return {}
@@ -103,26 +143,42 @@ class ExchangeUtils:
     def cache_response(self, ttl: int = 60):
         """
         Decorator to cache API responses.
+        Entries live in an LRU cache bounded to CACHE_MAXSIZE and expire after ttl seconds.
+        Calls with unhashable arguments are passed through uncached.
         """
         def decorator(func):
+            cache = self._get_ttl_cache(ttl)
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                cache_key = self._create_cache_key(func, args, kwargs)
-                
-                if cache_key in self.cache:
-                    cached_time, response = self.cache[cache_key]
-                    if time.time() - cached_time < ttl:
-                        return response
-                
+                try:
+                    cache_key = self._create_cache_key(func, args, kwargs)
+                    result = cache.get(cache_key, _MISSING)
+                except TypeError:
+                    return func(*args, **kwargs)
+                except KeyError:
+                    # cachetools' get() tests then reads; an entry expiring in between is a miss
+                    result = _MISSING
+                if result is not _MISSING:
+                    return result
+
                 result = func(*args, **kwargs)
-                self.cache[cache_key] = (time.time(), result)
+                cache[cache_key] = result
                 return result
             return wrapper
         return decorator
 
-    def _create_cache_key(self, func, args, kwargs) -> str:
-        """Create a unique cache key for function calls"""
-        return f"{func.__name__}:{str(args)}:{str(kwargs)}"
+    def _get_ttl_cache(self, ttl):
+        """Return the shared cache for the given ttl, creating it on first use"""
+        if ttl not in self.cache:
+            cache_cls = TTLCache if TTLCache is not None else _LRUTTLCache
+            self.cache[ttl] = cache_cls(maxsize=CACHE_MAXSIZE, ttl=ttl)
+        return self.cache[ttl]
+
+    @staticmethod
+    def _create_cache_key(func, args, kwargs) -> tuple:
+        """Create a hashable cache key for function calls, without building strings"""
+        return (func.__module__, func.__qualname__, args, frozenset(kwargs.items()))
 
     def batch_requests(self, endpoint: str, items: list, batch_size: int = 100):
         """
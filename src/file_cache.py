@@ -0,0 +1,78 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+_MISSING = object()
+
+
+class FileCache:
+    """
+    On-disk key/value cache with a time-to-live, shared by every process that uses the same directory.
+    Each key is pickled to its own file and written atomically, so concurrent readers never see a partial entry.
+    """
+
+    def __init__(self, cache_dir=".cache/api", ttl=300):
+        """
+        Initialize the file cache.
+        :param cache_dir: Directory holding the cache entries.
+        :param ttl: Seconds after which an entry is considered stale.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def get(self, key, default=None):
+        """
+        Read a fresh entry.
+        :param key: Cache key.
+        :param default: Value returned when the entry is missing, stale or unreadable.
+        :return: Cached value or default.
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return default
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            logging.error(f"Error reading cache entry {key}: {e}")
+            return default
+
+    def set(self, key, value):
+        """
+        Write an entry, replacing any previous value.
+        :param key: Cache key.
+        :param value: Picklable value.
+        """
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=5)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logging.error(f"Error writing cache entry {key}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def get_or_set(self, key, compute):
+        """
+        Return the cached value, computing and storing it on a miss.
+        :param key: Cache key.
+        :param compute: Zero-argument callable producing the value.
+        :return: Cached or freshly computed value.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def _path(self, key):
+        return self.cache_dir / f"{hashlib.md5(key.encode()).hexdigest()}.pkl"
@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logging(log_dir="data/logs", log_file="bot_logs.txt", error_file="errors.log"):
     """
@@ -8,6 +10,7 @@ def setup_logging(log_dir="data/logs", log_file="bot_logs.txt", error_file="erro
     :param log_dir: Directory to store log files.
     :param log_file: File for general logs.
     :param error_file: File for error logs.
+    :return: The QueueListener writing records to the handlers (stopped automatically at exit).
     """
     # Ensure log directory exists
     os.makedirs(log_dir, exist_ok=True)
@@ -34,7 +37,16 @@ def setup_logging(log_dir="data/logs", log_file="bot_logs.txt", error_file="erro
     console_formatter = logging.Formatter("%(name)s - %(levelname)s - %(message)s")
     console_handler.setFormatter(console_formatter)
 
+    # Loggers only enqueue records; formatting and file I/O happen on the listener thread
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, general_handler, error_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     # Root logger configuration
-    logging.basicConfig(level=logging.INFO, handlers=[general_handler, error_handler, console_handler])
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
 
     logging.info("Logging initialized.")
+    return listener
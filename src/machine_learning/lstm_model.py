@@ -1,9 +1,9 @@
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.optimizers import Adam
-from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error
 
@@ -18,9 +18,51 @@ class LSTMModel:
         :param sequence_length: Number of time steps for input sequences.
         """
         self.sequence_length = sequence_length
-        self.scaler = StandardScaler()
+        self.mean_ = None  # Per-feature float32 scaling statistics, set by fit_transform
+        self.std_ = None
         self.model = None
 
+    def fit_transform(self, data):
+        """
+        Fit the per-feature mean/std in float32 and standardize the data with them.
+        :param data: 2D array of shape (rows, features).
+        :return: Standardized float32 copy of the data.
+        """
+        data = np.array(data, dtype=np.float32)
+        self.mean_ = data.mean(axis=0)
+        self.std_ = data.std(axis=0)
+        self.std_[self.std_ == 0] = 1.0  # Constant features are only centred, as StandardScaler does
+        return self._scale_inplace(data)
+
+    def transform(self, data):
+        """
+        Standardize data with the fitted statistics.
+        :param data: Array whose last axis holds the features.
+        :return: Standardized float32 copy of the data.
+        """
+        return self._scale_inplace(np.array(data, dtype=np.float32))
+
+    def inverse_transform(self, data):
+        """
+        Map standardized values back to the original scale.
+        :param data: Array whose last axis holds the standardized features.
+        :return: float32 array in the original units.
+        """
+        data = np.array(data, dtype=np.float32)
+        data *= self.std_
+        data += self.mean_
+        return data
+
+    def _scale_inplace(self, data):
+        """
+        Standardize a float32 array in place, without float64 temporaries.
+        :param data: float32 array owned by the caller.
+        :return: The same array, standardized.
+        """
+        data -= self.mean_
+        data /= self.std_
+        return data
+
     def prepare_data(self, data, target_column):
         """
         Prepare data for LSTM training.
@@ -28,14 +70,14 @@ class LSTMModel:
         :param target_column: Name of the target column.
         :return: Scaled data and sequences for training/testing.
         """
-        data_scaled = self.scaler.fit_transform(data)
-        X, y = [], []
-
-        for i in range(self.sequence_length, len(data_scaled)):
-            X.append(data_scaled[i - self.sequence_length:i, :-1])
-            y.append(data_scaled[i, -1])
+        data_scaled = self.fit_transform(data)
 
-        return np.array(X), np.array(y)
+        # Window i covers rows [i, i + sequence_length) and predicts row i + sequence_length.
+        # sliding_window_view is a zero-copy strided view of shape (n_windows, features, steps).
+        windows = sliding_window_view(data_scaled[:, :-1], self.sequence_length, axis=0)
+        X = windows[:-1].transpose(0, 2, 1)
+        y = data_scaled[self.sequence_length:, -1]
+        return X, y
 
     def build_model(self, input_shape):
         """
@@ -80,8 +122,8 @@ class LSTMModel:
         :param data: DataFrame or array containing input features.
         :return: Predicted values.
         """
-        data_scaled = self.scaler.transform(data)
-        X = np.array([data_scaled[-self.sequence_length:]])
+        # Only the last window is used, scaled in float32 (what Keras computes in)
+        X = self.transform(np.asarray(data)[-self.sequence_length:])[np.newaxis]
         predictions = self.model.predict(X)
         return predictions.flatten()
 
@@ -1,22 +1,35 @@
 import joblib
+import numpy as np
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
 import pandas as pd
 
+try:
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 class RandomForestModel:
     """
     Implements a Random Forest model for trading decision-making.
     """
 
-    def __init__(self, n_estimators=100, max_depth=None, random_state=42):
+    def __init__(self, n_estimators=100, max_depth=None, random_state=42, n_jobs=-1):
         """
         Initialize the Random Forest model.
         :param n_estimators: Number of trees in the forest.
         :param max_depth: Maximum depth of the trees.
         :param random_state: Random state for reproducibility.
+        :param n_jobs: Number of cores used to fit and predict trees in parallel (-1 = all cores).
         """
-        self.model = RandomForestClassifier(n_estimators=n_estimators, max_depth=max_depth, random_state=random_state)
+        self.model = RandomForestClassifier(
+            n_estimators=n_estimators, max_depth=max_depth, random_state=random_state, n_jobs=n_jobs
+        )
+        self.onnx_session = None
 
     def train(self, data, target_column, test_size=0.2):
         """
@@ -43,9 +56,19 @@ class RandomForestModel:
     def predict(self, data):
         """
         Predict trading signals using the trained model.
-        :param data: DataFrame with feature columns.
+        :param data: DataFrame or array with feature columns.
         :return: Array of predictions.
         """
+        if self.onnx_session is not None:
+            X = np.ascontiguousarray(data, dtype=np.float32)
+            return self.onnx_session.run(None, {"X": X})[0]
+
+        # The trees compare float32 thresholds, so hand them float32 directly instead of
+        # letting sklearn make a float64 copy and then a float32 one
+        if isinstance(data, pd.DataFrame):
+            data = data.astype(np.float32, copy=False)
+        else:
+            data = np.ascontiguousarray(data, dtype=np.float32)
         return self.model.predict(data)
 
     def feature_importance(self):
@@ -60,7 +83,8 @@ class RandomForestModel:
         Save the trained model to a file.
         :param output_path: Path to save the model.
         """
-        joblib.dump(self.model, output_path)
+        # Left uncompressed so load_model can memory-map the tree arrays
+        joblib.dump(self.model, output_path, protocol=5)
         print(f"Model saved to {output_path}")
 
     def load_model(self, model_path):
@@ -68,9 +92,36 @@ class RandomForestModel:
         Load a trained model from a file.
         :param model_path: Path to the model file.
         """
-        self.model = joblib.load(model_path)
+        # Tree arrays are mapped read-only rather than copied, so processes share the pages
+        self.model = joblib.load(model_path, mmap_mode="r")
         print(f"Model loaded from {model_path}")
 
+    def export_onnx(self, output_path="models/random_forest.onnx"):
+        """
+        Export the trained model to ONNX for inference with onnxruntime.
+        :param output_path: Path to save the ONNX model.
+        """
+        if not ONNX_AVAILABLE:
+            raise ImportError("ONNX export requires skl2onnx and onnxruntime.")
+        onnx_model = convert_sklearn(
+            self.model,
+            initial_types=[("X", FloatTensorType([None, self.model.n_features_in_]))],
+            options={id(self.model): {"zipmap": False}},
+        )
+        with open(output_path, "wb") as f:
+            f.write(onnx_model.SerializeToString())
+        print(f"ONNX model saved to {output_path}")
+
+    def load_onnx(self, model_path):
+        """
+        Load an exported ONNX model; predict() then runs through onnxruntime.
+        :param model_path: Path to the ONNX model file.
+        """
+        if not ONNX_AVAILABLE:
+            raise ImportError("ONNX inference requires onnxruntime.")
+        self.onnx_session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        print(f"ONNX model loaded from {model_path}")
+
     @staticmethod
     def evaluate_model(y_true, y_pred):
         """
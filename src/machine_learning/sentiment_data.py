@@ -1,7 +1,24 @@
+import string
+import numpy as np
 import pandas as pd
 import requests
 from datetime import datetime
-from textblob import TextBlob
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+_analyzer = None
+_PUNCT_BYTES = np.frombuffer(string.punctuation.encode("ascii"), dtype=np.uint8)
+
+
+def _get_analyzer():
+    """
+    Return the shared VADER analyzer, loading its lexicon on first use.
+    Requires the lexicon to be installed once with nltk.download("vader_lexicon").
+    """
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = SentimentIntensityAnalyzer()
+    return _analyzer
+
 
 class SentimentData:
     """
@@ -52,14 +69,33 @@ class SentimentData:
     @staticmethod
     def process_sentiment(data):
         """
-        Analyze sentiment of text data using TextBlob.
+        Analyze sentiment of text data using VADER compound scores.
         :param data: DataFrame with 'text' column.
-        :return: DataFrame with added 'sentiment' column.
+        :return: DataFrame with added 'sentiment' and 'sentiment_label' columns.
         """
-        data["sentiment"] = data["text"].apply(lambda x: TextBlob(x).sentiment.polarity)
-        data["sentiment_label"] = data["sentiment"].apply(lambda x: 1 if x > 0 else (0 if x == 0 else -1))
+        analyzer = _get_analyzer()
+        texts = data["text"].to_numpy()
+        scores = np.fromiter(
+            (analyzer.polarity_scores(text)["compound"] for text in texts), dtype=np.float32, count=len(texts)
+        )
+        data["sentiment"] = scores
+        data["sentiment_label"] = np.sign(scores).astype(np.int8)
         return data
 
+    @staticmethod
+    def char_class_counts(text):
+        """
+        Count character classes in one linear pass over the UTF-8 bytes (ASCII classes only).
+        :param text: Input string.
+        :return: Dictionary with 'upper', 'digit' and 'punct' counts.
+        """
+        b = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        return {
+            "upper": int(((b >= 65) & (b <= 90)).sum()),
+            "digit": int(((b >= 48) & (b <= 57)).sum()),
+            "punct": int(np.isin(b, _PUNCT_BYTES).sum()),
+        }
+
     def save_to_csv(self, data, output_path):
         """
         Save processed sentiment data to a CSV file.
@@ -1,6 +1,7 @@
+import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.metrics import accuracy_score, classification_report
 import joblib
@@ -10,26 +11,38 @@ class SentimentModel:
     Implements sentiment analysis for market data using NLP.
     """
 
+    # Vocabulary cap for the count and tfidf vectorizers
+    MAX_FEATURES = 50000
+
+    # Largest rows x vocabulary input that predict() densifies (16 MB as float32)
+    DENSE_PREDICT_MAX_CELLS = 1 << 22
+
     def __init__(self, vectorizer_type="tfidf"):
         """
         Initialize the SentimentModel with the specified vectorizer type.
-        :param vectorizer_type: "count" for CountVectorizer or "tfidf" for TfidfVectorizer.
+        :param vectorizer_type: "count" for CountVectorizer, "tfidf" for TfidfVectorizer or "hashing" for a
+                                stateless HashingVectorizer trained in streaming mini-batches.
         """
+        # float32 matrices halve the bytes fed to MultinomialNB; a capped vocabulary keeps fit time bounded
         if vectorizer_type == "count":
-            self.vectorizer = CountVectorizer()
+            self.vectorizer = CountVectorizer(dtype=np.float32, max_features=self.MAX_FEATURES)
         elif vectorizer_type == "tfidf":
-            self.vectorizer = TfidfVectorizer()
+            self.vectorizer = TfidfVectorizer(dtype=np.float32, max_features=self.MAX_FEATURES)
+        elif vectorizer_type == "hashing":
+            # Non-negative counts, as required by MultinomialNB
+            self.vectorizer = HashingVectorizer(n_features=1 << 20, alternate_sign=False, norm=None, dtype=np.float32)
         else:
-            raise ValueError("Invalid vectorizer type. Choose 'count' or 'tfidf'.")
+            raise ValueError("Invalid vectorizer type. Choose 'count', 'tfidf' or 'hashing'.")
         self.model = MultinomialNB()
 
-    def train(self, data, text_column, target_column, test_size=0.2):
+    def train(self, data, text_column, target_column, test_size=0.2, batch_size=10000):
         """
         Train the sentiment analysis model.
         :param data: DataFrame containing text and target columns.
         :param text_column: Name of the text column.
         :param target_column: Name of the target column.
         :param test_size: Proportion of data to use for testing.
+        :param batch_size: Mini-batch size for streaming training with the hashing vectorizer.
         :return: Dictionary with training metrics.
         """
         X = data[text_column]
@@ -37,10 +50,18 @@ class SentimentModel:
 
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=42)
 
-        X_train_vec = self.vectorizer.fit_transform(X_train)
-        X_test_vec = self.vectorizer.transform(X_test)
+        if isinstance(self.vectorizer, HashingVectorizer):
+            # Single pass, no vocabulary: vectorize and fit one mini-batch at a time
+            classes = np.unique(y)
+            n_batches = max(1, -(-len(X_train) // batch_size))
+            for X_batch, y_batch in zip(np.array_split(X_train.to_numpy(), n_batches),
+                                        np.array_split(y_train.to_numpy(), n_batches)):
+                self.model.partial_fit(self.vectorizer.transform(X_batch), y_batch, classes=classes)
+        else:
+            X_train_vec = self.vectorizer.fit_transform(X_train)
+            self.model.fit(X_train_vec, y_train)
 
-        self.model.fit(X_train_vec, y_train)
+        X_test_vec = self.vectorizer.transform(X_test)
 
         y_pred = self.model.predict(X_test_vec)
         metrics = self.evaluate_model(y_test, y_pred)
@@ -56,6 +77,12 @@ class SentimentModel:
         :return: Array of predicted sentiment labels.
         """
         text_vec = self.vectorizer.transform(text_data)
+        # Small batches (e.g. a single headline) over a fitted vocabulary go through the dense BLAS
+        # path, which avoids sparse-matrix overhead on every call; large batches stay sparse.
+        # Hashed features are 2**20 columns wide with no vocabulary, so they always stay sparse.
+        hashed = isinstance(self.vectorizer, HashingVectorizer)
+        if not hashed and text_vec.shape[0] * len(self.vectorizer.vocabulary_) <= self.DENSE_PREDICT_MAX_CELLS:
+            text_vec = text_vec.toarray()
         return self.model.predict(text_vec)
 
     def save_model(self, vectorizer_path="models/vectorizer.pkl", model_path="models/sentiment_model.pkl"):
@@ -64,8 +91,9 @@ class SentimentModel:
         :param vectorizer_path: Path to save the vectorizer.
         :param model_path: Path to save the model.
         """
-        joblib.dump(self.vectorizer, vectorizer_path)
-        joblib.dump(self.model, model_path)
+        # Small artifacts that are read whole, so compress them
+        joblib.dump(self.vectorizer, vectorizer_path, compress=3, protocol=5)
+        joblib.dump(self.model, model_path, compress=3, protocol=5)
         print(f"Vectorizer saved to {vectorizer_path}")
         print(f"Model saved to {model_path}")
 
@@ -1,10 +1,13 @@
+import numpy as np
 import pandas as pd
 import joblib
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
+import tensorflow as tf
 from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import LSTM, Dense, Dropout
+from tensorflow.keras.layers import Conv1D, Dense, GlobalAveragePooling1D
 from tensorflow.keras.optimizers import Adam
 from sklearn.preprocessing import StandardScaler
 
@@ -14,7 +17,8 @@ class TrainModel:
     """
 
     def __init__(self):
-        self.scaler = StandardScaler()
+        # copy=False: prepare_lstm_data scales the float32 array it owns in place
+        self.scaler = StandardScaler(copy=False)
 
     def train_random_forest(self, data, target_column, output_path="models/random_forest.pkl"):
         """
@@ -29,20 +33,23 @@ class TrainModel:
 
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
+        model = RandomForestClassifier(n_estimators=100, random_state=42, n_jobs=-1)
         model.fit(X_train, y_train)
 
         y_pred = model.predict(X_test)
         metrics = self.evaluate_model(y_test, y_pred)
         print("Random Forest Metrics:", metrics)
 
-        joblib.dump(model, output_path)
+        # Left uncompressed so RandomForestModel.load_model can memory-map the tree arrays
+        joblib.dump(model, output_path, protocol=5)
         print(f"Random Forest model saved to {output_path}")
         return model, metrics
 
     def train_lstm(self, data, target_column, sequence_length=30, output_path="models/lstm_model.h5"):
         """
-        Train an LSTM model.
+        Train the sequence model (kept under the LSTM name for existing callers).
+        A small 1-D CNN is used instead of stacked LSTMs: far fewer weight reads per timestep
+        for 30-bar windows, so both training and inference are cheaper.
         :param data: DataFrame containing features and target column.
         :param target_column: Name of the target column.
         :param sequence_length: Length of input sequences.
@@ -54,15 +61,22 @@ class TrainModel:
         X_train, X_test, y_train, y_test = train_test_split(data["X"], data["y"], test_size=0.2, random_state=42)
 
         model = Sequential([
-            LSTM(50, return_sequences=True, input_shape=(X_train.shape[1], X_train.shape[2])),
-            Dropout(0.2),
-            LSTM(50),
-            Dropout(0.2),
+            Conv1D(32, 3, activation="relu", input_shape=(X_train.shape[1], X_train.shape[2])),
+            Conv1D(32, 3, activation="relu"),
+            GlobalAveragePooling1D(),
             Dense(1, activation="sigmoid"),
         ])
         model.compile(optimizer=Adam(learning_rate=0.001), loss="binary_crossentropy", metrics=["accuracy"])
 
-        model.fit(X_train, y_train, epochs=10, batch_size=32, validation_data=(X_test, y_test))
+        # Prefetching overlaps batch preparation with the training step
+        train_ds = (
+            tf.data.Dataset.from_tensor_slices((X_train, y_train))
+            .shuffle(len(X_train))
+            .batch(32)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        test_ds = tf.data.Dataset.from_tensor_slices((X_test, y_test)).batch(32).prefetch(tf.data.AUTOTUNE)
+        model.fit(train_ds, epochs=10, validation_data=test_ds)
 
         y_pred = model.predict(X_test).flatten()
         y_pred = (y_pred > 0.5).astype(int)
@@ -79,16 +93,20 @@ class TrainModel:
         :param data: DataFrame containing features and target column.
         :param target_column: Name of the target column.
         :param sequence_length: Length of input sequences.
-        :return: Dictionary with X (features) and y (target).
+        :return: Dictionary with X (features) and y (target) as float32 arrays.
         """
-        data = self.scaler.fit_transform(data)
-        X, y = [], []
-
-        for i in range(sequence_length, len(data)):
-            X.append(data[i-sequence_length:i, :-1])
-            y.append(data[i, -1])
-
-        return {"X": np.array(X), "y": np.array(y)}
+        # Single float32 copy of the input, standardized in place; the fitted mean/scale stay on
+        # self.scaler for inference
+        data = np.array(data, dtype=np.float32)
+        self.scaler.fit_transform(data)
+        features, target = data[:, :-1], data[:, -1]
+
+        # Zero-copy (n_windows, n_features, sequence_length) view; the last window has no target
+        windows = sliding_window_view(features, window_shape=sequence_length, axis=0)[:-1]
+        X = np.ascontiguousarray(windows.transpose(0, 2, 1), dtype=np.float32)
+        y = target[sequence_length:].astype(np.float32)
+
+        return {"X": X, "y": y}
 
     @staticmethod
     def evaluate_model(y_true, y_pred):
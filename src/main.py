@@ -6,12 +6,13 @@ from alpaca_trade_api import REST
 import pandas as pd
 import pytz
 from src.strategies.strategy_loader import StrategyLoader
-from src.machine_learning.random_forest import RandomForestModel
+from src.machine_learning.random_forest import ONNX_AVAILABLE, RandomForestModel
 from src.machine_learning.lstm_model import LSTMModel
 from src.machine_learning.sentiment_model import SentimentModel
 from src.plugins.sentiment_plugin import SentimentPlugin
 from src.plugins.hft_plugin import HFTPlugin
 from src.portfolio_manager import Portfolio
+from src.universe_cache import UniverseCache
 from src.config.logging_config import setup_logging
 
 # Load configuration
@@ -26,12 +27,22 @@ SECRET_KEY = config["SECRET_KEY"]
 BASE_URL = config["BASE_URL"]
 TRADE_SETTINGS = config["TRADE_SETTINGS"]
 MARKET_HOURS = config["MARKET_HOURS"]
+EASTERN_TZ = pytz.timezone("US/Eastern")
+MARKET_OPEN_TIME = dt_time.fromisoformat(MARKET_HOURS["MARKET_OPEN"])
+MARKET_CLOSE_TIME = dt_time.fromisoformat(MARKET_HOURS["MARKET_CLOSE"])
+SIGNAL_BARS = 30
+SIGNAL_LOOKBACK = timedelta(minutes=60)  # Window requested so each symbol has SIGNAL_BARS 1Min bars
+SNAPSHOT_CHUNK = 1000  # Symbols per snapshot request, keeps the query string bounded
+
+# symbol -> (timestamp of the last bar scored, ensemble signal)
+signal_cache = {}
 
 # Initialize Alpaca API
 api = REST(API_KEY, SECRET_KEY, BASE_URL, api_version="v2")
 
 # Initialize Core Components
 portfolio = Portfolio(config, api)
+universe_cache = UniverseCache(api)
 strategy_loader = StrategyLoader(config_dir="config/strategies/")
 hft_plugin = HFTPlugin(config, api)
 sentiment_plugin = SentimentPlugin()
@@ -47,7 +58,10 @@ try:
     lstm_model = LSTMModel(sequence_length=30)
     sentiment_model = SentimentModel()
     
-    random_forest.load_model(config["MACHINE_LEARNING"]["models"]["random_forest"]["path"])
+    rf_config = config["MACHINE_LEARNING"]["models"]["random_forest"]
+    random_forest.load_model(rf_config["path"])
+    if ONNX_AVAILABLE and rf_config.get("onnx_path"):
+        random_forest.load_onnx(rf_config["onnx_path"])
     lstm_model.load_model(config["MACHINE_LEARNING"]["models"]["lstm_model"]["path"])
     sentiment_model.load_model("models/pre_trained/vectorizer.pkl", 
                              config["MACHINE_LEARNING"]["models"]["sentiment_model"]["path"])
@@ -58,34 +72,49 @@ except Exception as e:
 
 def is_market_open():
     """Check if the market is open using configurable hours."""
-    tz = pytz.timezone("US/Eastern")
-    now = datetime.now(tz).time()
-    market_open = dt_time.fromisoformat(MARKET_HOURS["MARKET_OPEN"])
-    market_close = dt_time.fromisoformat(MARKET_HOURS["MARKET_CLOSE"])
-    return market_open <= now <= market_close
+    now = datetime.now(EASTERN_TZ).time()
+    return MARKET_OPEN_TIME <= now <= MARKET_CLOSE_TIME
+
+def get_live_quotes(symbols):
+    """Last price, daily volume and change vs. the previous close, from live snapshots."""
+    rows = []
+    for start in range(0, len(symbols), SNAPSHOT_CHUNK):
+        snapshots = api.get_snapshots(symbols[start:start + SNAPSHOT_CHUNK])
+        for symbol, snap in snapshots.items():
+            if snap is None or snap.latest_trade is None or snap.daily_bar is None or snap.prev_daily_bar is None:
+                continue
+            price = float(snap.latest_trade.price)
+            prev_close = float(snap.prev_daily_bar.close)
+            rows.append((symbol, price, float(snap.daily_bar.volume),
+                         (price / prev_close - 1) * 100 if prev_close else 0.0))
+    return pd.DataFrame(rows, columns=["symbol", "last_price", "volume", "change_percent"])
 
 def get_penny_stocks():
     """Retrieve volatile penny stocks with liquidity screening."""
     try:
-        assets = api.list_assets(status="active")
-        return [
-            asset.symbol for asset in assets
-            if all([
-                asset.tradable,
-                asset.exchange in ["NYSE", "NASDAQ"],
-                0.5 <= asset.last_price <= 5,
-                asset.volume >= 1_000_000,
-                abs(asset.change_percent) > config["TRADE_SETTINGS"]["HFT_SETTINGS"]["volatility_threshold"]
-            ])
-        ]
+        # Tradable NYSE/NASDAQ assets are cached per trading day; quotes are screened live every cycle
+        universe = universe_cache.get_universe(datetime.now(EASTERN_TZ).date())
+        if universe.empty:
+            return []
+        df = get_live_quotes(universe["symbol"].tolist())
+        if df.empty:
+            return []
+
+        mask = (
+            df["last_price"].between(0.5, 5)
+            & (df["volume"] >= 1_000_000)
+            & (df["change_percent"].abs() > config["TRADE_SETTINGS"]["HFT_SETTINGS"]["volatility_threshold"])
+        )
+        return df.loc[mask, "symbol"].tolist()
     except Exception as e:
         logging.error(f"Error fetching penny stocks: {e}")
         return []
 
-def calculate_position_size(symbol, price):
+def calculate_position_size(symbol, price, bars=None):
     """Calculate dynamic position size using portfolio manager."""
     try:
-        bars = api.get_bars(symbol, "1Min", limit=14).df
+        if bars is None:
+            bars = api.get_bars(symbol, "1Min", limit=15).df
         if bars.empty:
             return 0
             
@@ -95,15 +124,17 @@ def calculate_position_size(symbol, price):
         logging.error(f"Position sizing failed for {symbol}: {e}")
         return 0
 
-def execute_trade(symbol, signal):
+def execute_trade(symbol, signal, bars=None):
     """Execute trade with HFT optimization and risk management."""
     try:
-        bars = api.get_bars(symbol, "1Min", limit=1).df
+        # Reuse the bars the signal was computed from instead of re-requesting them
+        if bars is None:
+            bars = api.get_bars(symbol, "1Min", limit=SIGNAL_BARS).df
         if bars.empty:
             return
             
-        price = bars["close"].iloc[-1]
-        shares = calculate_position_size(symbol, price)
+        price = bars["close"].to_numpy()[-1]
+        shares = calculate_position_size(symbol, price, bars)
         
         if shares > 0:
             hft_plugin.execute_trade(symbol, signal, price, shares)
@@ -111,13 +142,25 @@ def execute_trade(symbol, signal):
     except Exception as e:
         logging.error(f"Trade execution failed for {symbol}: {e}")
 
-def aggregate_signals(symbol):
-    """Generate signals using ensemble strategy with real-time data."""
+def get_recent_bars(symbols):
+    """Fetch the latest 1Min bars for all symbols with a single request."""
     try:
-        bars = api.get_bars(symbol, "1Min", limit=30).df
+        # The multi-symbol limit applies to the whole response, so bound the request by time instead
+        start = (datetime.now(EASTERN_TZ) - SIGNAL_LOOKBACK).isoformat()
+        bars = api.get_bars(symbols, "1Min", start=start).df
         if bars.empty:
-            return 0
-            
+            return {}
+        return {
+            symbol: group.drop(columns="symbol").tail(SIGNAL_BARS)
+            for symbol, group in bars.groupby("symbol", sort=False)
+        }
+    except Exception as e:
+        logging.error(f"Error fetching bars: {e}")
+        return {}
+
+def aggregate_signals(symbol, bars):
+    """Generate signals using ensemble strategy with real-time data."""
+    try:
         # Get base signals from all strategies
         strategy_signals = {}
         for name, strategy in strategies.items():
@@ -131,14 +174,25 @@ def aggregate_signals(symbol):
         ensemble_result = ensemble_strategy.generate_signals(ensemble_data)
         
         # Apply ML confidence filter
-        if ensemble_result["Confidence"].iloc[-1] < TRADE_SETTINGS["CONFIDENCE_THRESHOLD"]:
+        if ensemble_result["Confidence"].to_numpy()[-1] < TRADE_SETTINGS["CONFIDENCE_THRESHOLD"]:
             return 0
             
-        return ensemble_result["Ensemble_Signal"].iloc[-1]
+        return ensemble_result["Ensemble_Signal"].to_numpy()[-1]
     except Exception as e:
         logging.error(f"Signal aggregation failed for {symbol}: {e}")
         return 0
 
+def cached_signal(symbol, bars):
+    """Ensemble signal for a symbol, recomputed only when a new bar has arrived since the last cycle."""
+    last_bar = bars.index[-1]
+    cached = signal_cache.get(symbol)
+    if cached is not None and cached[0] == last_bar:
+        return cached[1]
+
+    signal = aggregate_signals(symbol, bars)
+    signal_cache[symbol] = (last_bar, signal)
+    return signal
+
 def run_bot_cycle():
     """Main trading cycle with HFT optimization."""
     try:
@@ -154,10 +208,17 @@ def run_bot_cycle():
             logging.info("No qualifying penny stocks found")
             return
             
-        for symbol in symbols[:TRADE_SETTINGS["HFT_SETTINGS"]["max_trades_per_hour"]]:
-            signal = aggregate_signals(symbol)
+        symbols = symbols[:TRADE_SETTINGS["HFT_SETTINGS"]["max_trades_per_hour"]]
+
+        # One round trip for every symbol; symbols without recent bars are simply absent
+        recent_bars = get_recent_bars(symbols)
+        for symbol in set(signal_cache) - set(recent_bars):
+            del signal_cache[symbol]
+
+        for symbol, bars in recent_bars.items():
+            signal = cached_signal(symbol, bars)
             if signal != 0:
-                execute_trade(symbol, signal)
+                execute_trade(symbol, signal, bars)
                 
     except Exception as e:
         logging.error(f"Main trading cycle failed: {e}")
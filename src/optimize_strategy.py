@@ -34,7 +34,10 @@ class OptimizeStrategy:
         best_metrics = None
 
         for params in self.generate_param_combinations(param_grid):
-            strategy.__init__(params)  # Reinitialize strategy with parameters
+            if hasattr(strategy, "reconfigure"):
+                strategy.reconfigure(params)
+            else:
+                strategy.__init__(params)  # Legacy strategies without a reconfigure hook
             backtester = BacktestRunner(strategy, self.initial_balance)
             results = backtester.run_backtest(data)
             metrics = results["metrics"]
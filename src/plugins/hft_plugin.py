@@ -1,5 +1,6 @@
 import logging
 import time
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
@@ -49,14 +50,21 @@ class HFTPlugin:
         """
         Calculate the volatility of a stock using the Average True Range (ATR).
         :param data: DataFrame with historical price data (columns: 'high', 'low', 'close').
-        :return: Volatility (ATR) value.
+        :return: Volatility (ATR) value, NaN with fewer than 14 bars.
         """
-        high_low = data['high'] - data['low']
-        high_close = abs(data['high'] - data['close'].shift())
-        low_close = abs(data['low'] - data['close'].shift())
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=14).mean().iloc[-1]
-        return atr
+        # Only the latest ATR is needed: the last 14 true ranges plus one previous close
+        high = data['high'].to_numpy(dtype=np.float64)[-15:]
+        low = data['low'].to_numpy(dtype=np.float64)[-15:]
+        close = data['close'].to_numpy(dtype=np.float64)[-15:]
+        if len(close) < 14:
+            return np.nan
+
+        true_range = high - low
+        prev_close = close[:-1]
+        true_range[1:] = np.maximum(
+            true_range[1:], np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close))
+        )
+        return true_range[-14:].mean()
 
     def is_volatile_enough(self, symbol):
         """
@@ -1,6 +1,9 @@
 import requests
 from textblob import TextBlob
 import logging
+from src.file_cache import FileCache
+
+SENTIMENT_TTL_SECONDS = 300  # A score is at most this old when returned; the file cache is the only cache layer
 
 class SentimentPlugin:
     """
@@ -13,6 +16,8 @@ class SentimentPlugin:
         self.reddit_client_id = None
         self.reddit_client_secret = None
         self.news_api_key = None
+        # Shared with every other process (bot, dashboard) computing sentiment on this machine
+        self.file_cache = FileCache(cache_dir=".cache/sentiment", ttl=SENTIMENT_TTL_SECONDS)
 
     def fetch_twitter_sentiment(self, symbol):
         """
@@ -72,6 +77,16 @@ class SentimentPlugin:
     def analyze_sentiment(self, symbol):
         """
         Analyze sentiment from multiple sources for a given stock symbol.
+        Results are reused for SENTIMENT_TTL_SECONDS after they were computed, by this and
+        every other process sharing the cache directory, so repeated calls do not hit the APIs again.
+        :param symbol: Stock symbol (e.g., "AAPL").
+        :return: Weighted average sentiment polarity.
+        """
+        return self.file_cache.get_or_set(f"sentiment|{symbol}", lambda: self._compute_sentiment(symbol))
+
+    def _compute_sentiment(self, symbol):
+        """
+        Compute the weighted sentiment across all sources.
         :param symbol: Stock symbol (e.g., "AAPL").
         :return: Weighted average sentiment polarity.
         """
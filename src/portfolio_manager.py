@@ -109,12 +109,18 @@ class Portfolio:
         :param data: DataFrame with price history
         """
         try:
-            # Calculate 14-period ATR
-            high_low = data['high'] - data['low']
-            high_close = np.abs(data['high'] - data['close'].shift())
-            low_close = np.abs(data['low'] - data['close'].shift())
-            tr = np.maximum(high_low, high_close, low_close)
-            atr = tr.rolling(window=14).mean().iloc[-1]
+            # Calculate 14-period ATR: only the latest value is needed, so use the last
+            # 14 true ranges (plus one previous close) instead of a full rolling window
+            high = data['high'].to_numpy(dtype=np.float64)[-15:]
+            low = data['low'].to_numpy(dtype=np.float64)[-15:]
+            close = data['close'].to_numpy(dtype=np.float64)[-15:]
+            if len(close) < 15:
+                atr = np.nan
+            else:
+                prev_close = close[:-1]
+                tr = np.maximum(high[1:] - low[1:],
+                                np.maximum(np.abs(high[1:] - prev_close), np.abs(low[1:] - prev_close)))
+                atr = tr.mean()
             
             # Calculate standard deviation
             returns = data['close'].pct_change().dropna()
@@ -141,24 +147,26 @@ class Portfolio:
         """Calculate key performance metrics"""
         try:
             equity_df = self.get_equity_history()
-            returns = equity_df['equity'].pct_change().dropna()
+            equity = equity_df['equity'].to_numpy(dtype=np.float64)
+            returns = equity[1:] / equity[:-1] - 1
+            returns = returns[~np.isnan(returns)]
             
             # Sharpe Ratio
             risk_free_rate = 0.02 / 252  # Daily risk-free rate
             self.performance_metrics['sharpe_ratio'] = (
-                (returns.mean() - risk_free_rate) / returns.std() * np.sqrt(252)
+                (returns.mean() - risk_free_rate) / returns.std(ddof=1) * np.sqrt(252)
             )
             
-            # Max Drawdown
-            cumulative_returns = (1 + returns).cumprod()
-            peak = cumulative_returns.expanding(min_periods=1).max()
-            drawdown = (cumulative_returns / peak) - 1
-            self.performance_metrics['max_drawdown'] = drawdown.min()
+            # Max Drawdown: compounded returns against their running peak
+            cumulative_returns = np.cumprod(1 + returns)
+            peak = np.maximum.accumulate(cumulative_returns)
+            self.performance_metrics['max_drawdown'] = (cumulative_returns / peak - 1).min()
             
             # Win Rate (if trade history available)
             if self.trade_history:
-                wins = sum(1 for t in self.trade_history if t['profit'] > 0)
-                self.performance_metrics['win_rate'] = wins / len(self.trade_history)
+                profits = np.fromiter((t['profit'] for t in self.trade_history),
+                                      dtype=np.float64, count=len(self.trade_history))
+                self.performance_metrics['win_rate'] = float((profits > 0).mean())
                 
         except Exception as e:
             logging.error(f"Error updating performance metrics: {e}")
@@ -1,10 +1,13 @@
 import pandas as pd
+from src.strategies.base import ReconfigurableMixin
 
-class Strategy:
+class Strategy(ReconfigurableMixin):
     """
     Implements the Double Exponential Moving Average (DEMA) strategy.
     """
 
+    PARAMS = {"weight": "weight", "thresholds": "thresholds"}
+
     def __init__(self, config):
         """
         Initialize the DEMA strategy with configuration.
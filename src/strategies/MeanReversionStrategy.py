@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
+from src.strategies.base import ReconfigurableMixin
 
-class MeanReversionStrategy:
+class MeanReversionStrategy(ReconfigurableMixin):
     """
     Implements the Mean Reversion strategy optimized for penny stocks.
     Penny stocks are volatile but often revert to their mean. This strategy focuses on:
@@ -10,6 +11,16 @@ class MeanReversionStrategy:
     - Adding dynamic stop-loss and take-profit levels for risk management.
     """
 
+    PARAMS = {
+        "lookback_period": "lookback_period",
+        "upper_multiplier": "upper_multiplier",
+        "lower_multiplier": "lower_multiplier",
+        "volatility_threshold": "volatility_threshold",
+        "volume_threshold": "volume_threshold",
+        "stop_loss": "stop_loss",
+        "take_profit": "take_profit",
+    }
+
     def __init__(self, config):
         """
         Initialize the Mean Reversion strategy with configuration.
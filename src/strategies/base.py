@@ -0,0 +1,16 @@
+class ReconfigurableMixin:
+    """
+    Lets a strategy update its tunable parameters in place.
+    """
+
+    # Config key -> attribute name, declared by each strategy
+    PARAMS = {}
+
+    def reconfigure(self, config):
+        """
+        Update parameters from the configuration; missing keys keep their current values.
+        :param config: Dictionary with any subset of the strategy parameters.
+        """
+        for key, attribute in self.PARAMS.items():
+            if key in config:
+                setattr(self, attribute, config[key])
@@ -1,7 +1,8 @@
 import pandas as pd
 import numpy as np
+from src.strategies.base import ReconfigurableMixin
 
-class BreakoutStrategy:
+class BreakoutStrategy(ReconfigurableMixin):
     """
     Implements the Breakout strategy optimized for penny stocks.
     Penny stocks often experience sudden price movements, so this strategy focuses on:
@@ -10,6 +11,14 @@ class BreakoutStrategy:
     - Incorporating volume spikes to confirm breakouts.
     """
 
+    PARAMS = {
+        "lookback_period": "lookback_period",
+        "volatility_threshold": "volatility_threshold",
+        "volume_multiplier": "volume_multiplier",
+        "stop_loss": "stop_loss",
+        "take_profit": "take_profit",
+    }
+
     def __init__(self, config):
         """
         Initialize the Breakout strategy with configuration.
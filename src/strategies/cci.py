@@ -1,10 +1,13 @@
 import pandas as pd
+from src.strategies.base import ReconfigurableMixin
 
-class Strategy:
+class Strategy(ReconfigurableMixin):
     """
     Implements the Commodity Channel Index (CCI) strategy.
     """
 
+    PARAMS = {"constant": "constant", "history": "history", "thresholds": "thresholds"}
+
     def __init__(self, config):
         """
         Initialize the CCI strategy with configuration.
@@ -1,10 +1,18 @@
 import pandas as pd
+from src.strategies.base import ReconfigurableMixin
 
-class Strategy:
+class Strategy(ReconfigurableMixin):
     """
     Implements the Moving Average Convergence Divergence (MACD) strategy.
     """
 
+    PARAMS = {
+        "short": "short_period",
+        "long": "long_period",
+        "signal": "signal_period",
+        "thresholds": "thresholds",
+    }
+
     def __init__(self, config):
         """
         Initialize the MACD strategy with configuration.
@@ -15,7 +15,7 @@ class StrategyLoader:
     def load_strategies(self):
         """Load strategies dynamically using CamelCase class naming convention."""
         for file in os.listdir(self.strategies_dir):
-            if file.endswith(".py") and file not in ["__init__.py", "strategy_loader.py"]:
+            if file.endswith(".py") and file not in ["__init__.py", "strategy_loader.py", "base.py"]:
                 strategy_name = file[:-3]  # Remove '.py'
                 module_path = f"src.strategies.{strategy_name}"
                 
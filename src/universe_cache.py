@@ -0,0 +1,88 @@
+import logging
+from datetime import date
+from pathlib import Path
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401 (parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+STATIC_COLUMNS = ["symbol", "exchange"]  # Fields that do not change during a session
+
+
+class UniverseCache:
+    """
+    Daily on-disk cache of the tradable asset universe.
+    The active asset list only changes between sessions, so it is fetched from the API
+    once per trading date and read back from disk (and memory) for the rest of the day.
+    Only static asset fields are kept; prices and volume must be fetched live by the caller.
+    """
+
+    def __init__(self, api, cache_dir=".cache", exchanges=("NYSE", "NASDAQ")):
+        """
+        Initialize the universe cache.
+        :param api: Alpaca REST client.
+        :param cache_dir: Directory holding one snapshot file per trading date.
+        :param exchanges: Exchanges kept in the universe.
+        """
+        self.api = api
+        self.cache_dir = Path(cache_dir)
+        self.exchanges = list(exchanges)
+        self._day = None
+        self._universe = None
+
+    def get_universe(self, day=None):
+        """
+        Tradable assets on the configured exchanges, as of the given trading date.
+        :param day: Trading date (defaults to today).
+        :return: DataFrame with the symbol and exchange of each asset.
+        """
+        day = day or date.today()
+        if day == self._day:
+            return self._universe
+
+        path = self._snapshot_path(day)
+        if path.exists():
+            universe = pd.read_parquet(path) if PARQUET_AVAILABLE else pd.read_pickle(path)
+        else:
+            universe = self._fetch()
+            self._save(universe, path)
+
+        self._day, self._universe = day, universe
+        return universe
+
+    def _fetch(self):
+        """
+        Fetch active assets and keep the tradable ones on the configured exchanges.
+        :return: DataFrame with the symbol and exchange of each kept asset.
+        """
+        assets = self.api.list_assets(status="active")
+        universe = pd.DataFrame([asset._raw for asset in assets])
+        if universe.empty:
+            return pd.DataFrame(columns=STATIC_COLUMNS)
+        mask = universe["tradable"].astype(bool) & universe["exchange"].isin(self.exchanges)
+        return universe.loc[mask, STATIC_COLUMNS].reset_index(drop=True)
+
+    def _save(self, universe, path):
+        """
+        Write today's snapshot and drop snapshots from earlier dates.
+        :param universe: DataFrame to persist.
+        :param path: Snapshot path for the current date.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if PARQUET_AVAILABLE:
+                universe.to_parquet(path, index=False)
+            else:
+                universe.to_pickle(path)
+            for stale in self.cache_dir.glob("universe_*"):
+                if stale != path:
+                    stale.unlink()
+        except Exception as e:
+            logging.error(f"Error writing universe cache: {e}")
+
+    def _snapshot_path(self, day):
+        suffix = "parquet" if PARQUET_AVAILABLE else "pkl"
+        return self.cache_dir / f"universe_{day.isoformat()}.{suffix}"
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.candle_batcher import CandleBatcher
+
+
+def reference_aggregate(candles, minutes):
+    resampled = candles.set_index("timestamp").resample(f"{minutes}min").agg({
+        "open": "first",
+        "high": "max",
+        "low": "min",
+        "close": "last",
+        "volume": "sum",
+    })
+    aggregated = resampled.dropna().reset_index()
+    # The batcher buckets on nanosecond integers, whatever resolution the input had
+    aggregated["timestamp"] = aggregated["timestamp"].dt.as_unit("ns")
+    return aggregated
+
+
+class TestCandleBatcher(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        timestamps = pd.date_range("2024-01-02 09:30", periods=120, freq="min")
+        # Drop a stretch of minutes so one 15-minute bucket is empty
+        timestamps = timestamps.delete(range(45, 62))
+        close = 100 + rng.standard_normal(len(timestamps)).cumsum()
+        self.candles = pd.DataFrame({
+            "timestamp": timestamps,
+            "open": close + rng.normal(0, 0.1, len(close)),
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.integers(1000, 5000, len(close)),
+        })
+
+    def test_matches_pandas_resample(self):
+        aggregated = CandleBatcher(target_interval=15).aggregate_candles(self.candles)
+
+        pd.testing.assert_frame_equal(aggregated, reference_aggregate(self.candles, 15), check_freq=False)
+
+    def test_keeps_timezone(self):
+        candles = self.candles.assign(timestamp=self.candles["timestamp"].dt.tz_localize("America/New_York"))
+        aggregated = CandleBatcher(target_interval=15).aggregate_candles(candles)
+
+        pd.testing.assert_frame_equal(aggregated, reference_aggregate(candles, 15), check_freq=False)
+
+    def test_accepts_string_timestamps(self):
+        candles = self.candles.assign(timestamp=self.candles["timestamp"].dt.strftime("%Y-%m-%d %H:%M:%S"))
+        aggregated = CandleBatcher(target_interval=15).aggregate_candles(candles)
+
+        pd.testing.assert_frame_equal(aggregated, reference_aggregate(self.candles, 15), check_freq=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
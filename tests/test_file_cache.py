@@ -0,0 +1,74 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.file_cache import FileCache
+
+
+class TestFileCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = FileCache(cache_dir=self._tmp.name, ttl=60)
+
+    def test_round_trip(self):
+        self.cache.set("AAPL", {"score": 0.5})
+
+        self.assertEqual(self.cache.get("AAPL"), {"score": 0.5})
+        self.assertEqual(FileCache(cache_dir=self._tmp.name).get("AAPL"), {"score": 0.5})
+
+    def test_missing_key_returns_default(self):
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.get("missing", "fallback"), "fallback")
+
+    def test_stale_entry_expires(self):
+        self.cache.set("AAPL", 1)
+        stale = time.time() - 61
+        os.utime(self.cache._path("AAPL"), (stale, stale))
+
+        self.assertEqual(self.cache.get("AAPL", "expired"), "expired")
+
+    def test_set_replaces_entry_and_leaves_no_temp_files(self):
+        self.cache.set("AAPL", 1)
+        self.cache.set("AAPL", 2)
+
+        self.assertEqual(self.cache.get("AAPL"), 2)
+        self.assertEqual(os.listdir(self._tmp.name), [self.cache._path("AAPL").name])
+
+    def test_failed_write_keeps_previous_entry(self):
+        self.cache.set("AAPL", 1)
+        self.cache.set("AAPL", threading.Lock())  # unpicklable
+
+        self.assertEqual(self.cache.get("AAPL"), 1)
+        self.assertEqual(os.listdir(self._tmp.name), [self.cache._path("AAPL").name])
+
+    def test_readers_never_see_a_partial_entry(self):
+        real_replace = os.replace
+        seen = []
+
+        def replace_after_read(src, dst):
+            # The new value is complete on disk, but not yet visible under the entry's name
+            seen.append(self.cache.get("AAPL"))
+            real_replace(src, dst)
+
+        self.cache.set("AAPL", "old")
+        with mock.patch("src.file_cache.os.replace", side_effect=replace_after_read):
+            self.cache.set("AAPL", "new")
+
+        self.assertEqual(seen, ["old"])
+        self.assertEqual(self.cache.get("AAPL"), "new")
+
+    def test_get_or_set_computes_once(self):
+        compute = mock.Mock(return_value=42)
+
+        self.assertEqual(self.cache.get_or_set("AAPL", compute), 42)
+        self.assertEqual(self.cache.get_or_set("AAPL", compute), 42)
+        compute.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting import kernels
+
+
+def reference_rsi(close, period):
+    """Wilder's RSI: simple-average seed over the first period, then alpha = 1/period smoothing."""
+    delta = pd.Series(close).diff()
+    averages = []
+    for values in (delta.clip(lower=0), (-delta).clip(lower=0)):
+        seeded = values.copy()
+        seeded.iloc[:period + 1] = np.nan
+        seeded.iloc[period] = values.iloc[1:period + 1].mean()
+        averages.append(seeded.ewm(alpha=1 / period, adjust=False).mean())
+    gain, loss = averages
+    return (100 - 100 / (1 + gain / loss)).to_numpy()
+
+
+def reference_metrics(pnl, initial_balance, risk_free_rate=0.01):
+    pnl = pd.Series(pnl)
+    excess = pnl / initial_balance - risk_free_rate / kernels.TRADING_DAYS
+    equity = initial_balance + pnl.cumsum()
+    peak = equity.cummax().clip(lower=initial_balance)
+    return (
+        pnl.sum(),
+        excess.mean() / excess.std(ddof=1),
+        ((equity - peak) / peak).min(),
+        (pnl > 0).mean(),
+    )
+
+
+class KernelTestCase(unittest.TestCase):
+    """Runs every check on the NumPy fallback and, when installed, on the Numba kernels."""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.close = 100 + rng.standard_normal(500).cumsum()
+        self.signal = rng.choice([-1.0, 0.0, 1.0], size=500)
+
+    def for_each_backend(self, check):
+        backends = [False, True] if kernels.NUMBA_AVAILABLE else [False]
+        for numba_enabled in backends:
+            with self.subTest(numba=numba_enabled), mock.patch.object(kernels, "NUMBA_AVAILABLE", numba_enabled):
+                check()
+
+
+class TestRollingKernels(KernelTestCase):
+
+    def test_rolling_mean_matches_pandas(self):
+        expected = pd.Series(self.close).rolling(20).mean().to_numpy()
+        self.for_each_backend(lambda: np.testing.assert_allclose(
+            kernels.rolling_mean(self.close, 20), expected, rtol=1e-10, equal_nan=True))
+
+    def test_rolling_std_matches_pandas(self):
+        expected = pd.Series(self.close).rolling(20).std().to_numpy()
+        self.for_each_backend(lambda: np.testing.assert_allclose(
+            kernels.rolling_std(self.close, 20), expected, rtol=1e-8, equal_nan=True))
+
+    def test_rolling_mean_keeps_float32(self):
+        close = self.close.astype(np.float32)
+        self.for_each_backend(lambda: self.assertEqual(kernels.rolling_mean(close, 20).dtype, np.float32))
+
+    def test_rsi_wilder_matches_reference(self):
+        expected = reference_rsi(self.close, 14)
+
+        def check():
+            result = kernels.rsi_wilder(self.close, 14)
+            self.assertTrue(np.isnan(result[:14]).all())
+            np.testing.assert_allclose(result[14:], expected[14:], rtol=1e-8)
+
+        self.for_each_backend(check)
+
+
+class TestMetricKernels(KernelTestCase):
+
+    def test_fused_metrics_matches_pandas(self):
+        _, pnl, _ = kernels.run_backtest_numpy(self.close, self.signal, 10000)
+        expected = reference_metrics(pnl, 10000)
+        self.for_each_backend(lambda: np.testing.assert_allclose(
+            kernels.fused_metrics(pnl, 10000), expected, rtol=1e-8))
+
+    def test_drawdown_counts_losses_from_the_initial_balance(self):
+        pnl = np.array([-100.0, 50.0, 25.0])
+        self.for_each_backend(lambda: self.assertAlmostEqual(kernels.fused_metrics(pnl, 1000)[2], -0.1))
+
+    def test_sweep_metrics_matches_fused_metrics(self):
+        signals = np.vstack([self.signal, -self.signal, np.zeros_like(self.signal)])
+
+        def check():
+            scores = kernels.sweep_metrics(self.close, signals, 10000)
+            for row, signal in zip(scores, signals):
+                _, pnl, _ = kernels.run_backtest_numpy(self.close, signal, 10000)
+                np.testing.assert_allclose(row, kernels.fused_metrics(pnl, 10000), rtol=1e-8, atol=1e-12)
+
+        self.for_each_backend(check)
+
+    def test_total_pnl_matches_backtest(self):
+        _, pnl, _ = kernels.run_backtest_numpy(self.close, self.signal, 0.0)
+        self.for_each_backend(lambda: self.assertAlmostEqual(
+            kernels.total_pnl(self.close, self.signal), pnl.sum(), places=8))
+
+
+if __name__ == "__main__":
+    unittest.main()
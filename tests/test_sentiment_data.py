@@ -0,0 +1,30 @@
+import re
+import string
+import unittest
+
+from src.machine_learning.sentiment_data import SentimentData
+
+
+def reference_counts(text):
+    """One regex pass per character class, the approach char_class_counts replaces."""
+    return {
+        "upper": len(re.findall(r"[A-Z]", text)),
+        "digit": len(re.findall(r"[0-9]", text)),
+        "punct": len(re.findall(f"[{re.escape(string.punctuation)}]", text)),
+    }
+
+
+class TestCharClassCounts(unittest.TestCase):
+
+    def test_matches_regex_counts(self):
+        for text in ["$AAPL beats Q3 estimates by 12%!", "no caps, no digits", "", "ALL-CAPS 2024 (!!!)"]:
+            with self.subTest(text=text):
+                self.assertEqual(SentimentData.char_class_counts(text), reference_counts(text))
+
+    def test_counts_ascii_classes_only(self):
+        # Multi-byte characters never fall inside the ASCII ranges
+        self.assertEqual(SentimentData.char_class_counts("Émission ½ — ok"), {"upper": 0, "digit": 0, "punct": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
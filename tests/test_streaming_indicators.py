@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.backtesting.prepare_date_range import FEATURE_COLUMNS, preprocess_data
+from src.backtesting.streaming_indicators import StreamingIndicators
+
+
+class TestStreamingIndicators(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.bars = pd.DataFrame({
+            "timestamp": pd.date_range("2024-01-02 09:30", periods=300, freq="min"),
+            "close": 50 + rng.standard_normal(300).cumsum(),
+        })
+
+    def test_matches_batch_indicators(self):
+        batch = preprocess_data(self.bars.copy())
+        streamed = StreamingIndicators().update(self.bars)
+
+        self.assertEqual(streamed["timestamp"].tolist(), batch["timestamp"].tolist())
+        for column in ("SMA_20", "RSI"):
+            np.testing.assert_allclose(streamed[column], batch[column], rtol=1e-5)
+
+    def test_normalized_close_uses_running_statistics(self):
+        close = self.bars["close"]
+        expanding = (close - close.expanding().mean()) / close.expanding().std()
+        streamed = StreamingIndicators().update(self.bars)
+
+        np.testing.assert_allclose(streamed["Normalized_Close"], expanding.loc[streamed.index], rtol=1e-5, atol=1e-6)
+
+    def test_incremental_updates_match_single_update(self):
+        expected = StreamingIndicators().update(self.bars)
+
+        indicators = StreamingIndicators()
+        pieces = [indicators.update(self.bars.iloc[start:start + 37]) for start in range(0, len(self.bars), 37)]
+        streamed = pd.concat(pieces)
+
+        pd.testing.assert_frame_equal(streamed, expected)
+
+    def test_skips_bars_already_processed(self):
+        indicators = StreamingIndicators()
+        indicators.update(self.bars.iloc[:200])
+        overlap = indicators.update(self.bars.iloc[150:])
+
+        self.assertEqual(overlap["timestamp"].iloc[0], self.bars["timestamp"].iloc[200])
+        self.assertEqual(len(overlap), 100)
+
+    def test_features_are_float32(self):
+        streamed = StreamingIndicators().update(self.bars)
+
+        for column in FEATURE_COLUMNS:
+            self.assertEqual(streamed[column].dtype, np.float32)
+
+
+if __name__ == "__main__":
+    unittest.main()
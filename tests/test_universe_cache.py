@@ -0,0 +1,71 @@
+import tempfile
+import unittest
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock
+
+from src.universe_cache import STATIC_COLUMNS, UniverseCache
+
+ASSETS = [
+    {"symbol": "AAA", "exchange": "NYSE", "tradable": True, "status": "active"},
+    {"symbol": "BBB", "exchange": "NASDAQ", "tradable": True, "status": "active"},
+    {"symbol": "CCC", "exchange": "OTC", "tradable": True, "status": "active"},
+    {"symbol": "DDD", "exchange": "NYSE", "tradable": False, "status": "active"},
+]
+
+
+def make_api(assets=ASSETS):
+    api = mock.Mock()
+    api.list_assets.return_value = [SimpleNamespace(_raw=dict(asset)) for asset in assets]
+    return api
+
+
+class TestUniverseCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.day = date(2024, 1, 2)
+
+    def test_keeps_tradable_assets_on_configured_exchanges(self):
+        universe = UniverseCache(make_api(), cache_dir=self._tmp.name).get_universe(self.day)
+
+        self.assertEqual(universe["symbol"].tolist(), ["AAA", "BBB"])
+        self.assertEqual(list(universe.columns), STATIC_COLUMNS)
+
+    def test_fetches_once_per_day(self):
+        api = make_api()
+        cache = UniverseCache(api, cache_dir=self._tmp.name)
+        cache.get_universe(self.day)
+        cache.get_universe(self.day)
+
+        api.list_assets.assert_called_once()
+
+    def test_new_instance_reuses_snapshot(self):
+        UniverseCache(make_api(), cache_dir=self._tmp.name).get_universe(self.day)
+        api = make_api()
+        universe = UniverseCache(api, cache_dir=self._tmp.name).get_universe(self.day)
+
+        api.list_assets.assert_not_called()
+        self.assertEqual(universe["symbol"].tolist(), ["AAA", "BBB"])
+
+    def test_new_day_refetches_and_drops_old_snapshot(self):
+        api = make_api()
+        cache = UniverseCache(api, cache_dir=self._tmp.name)
+        cache.get_universe(self.day)
+        cache.get_universe(date(2024, 1, 3))
+
+        self.assertEqual(api.list_assets.call_count, 2)
+        snapshots = [path.name for path in cache.cache_dir.glob("universe_*")]
+        self.assertEqual(len(snapshots), 1)
+        self.assertIn("2024-01-03", snapshots[0])
+
+    def test_empty_asset_list(self):
+        universe = UniverseCache(make_api([]), cache_dir=self._tmp.name).get_universe(self.day)
+
+        self.assertTrue(universe.empty)
+        self.assertEqual(list(universe.columns), STATIC_COLUMNS)
+
+
+if __name__ == "__main__":
+    unittest.main()